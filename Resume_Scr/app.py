@@ -3,10 +3,16 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
-from resume_parser import parse_resume, calculate_ats_score
-from nlp_engine import (get_match_score, rank_resumes, extract_keywords, 
+from resume_parser import parse_resume, parse_resumes_batch, calculate_ats_score, extract_resume_text
+from ingest import UploadSpool, iter_batch_items, count_batch_files, compact_record
+from parse_cache import get_default_cache
+from candidate_index import get_candidate_index
+from skill_matrix import SkillMatrix
+from jd_library import get_jd_library, jd_fingerprint
+from nlp_engine import (extract_keywords, 
                         generate_suggestions, calculate_resume_strength,
-                        get_detailed_match_score)
+                        get_detailed_match_score, role_fit_scores,
+                        AnalysisContext, ScreeningSession)
 from roles import ROLES, get_role_category
 from skills import (skill_gap, extract_skills, categorize_skills, 
                     get_skill_recommendations, ALL_SKILLS)
@@ -128,7 +134,7 @@ if mode == "👤 User Mode":
     if uploaded_file:
         with st.spinner("🔍 Analyzing your resume..."):
             # Parse resume
-            resume = parse_resume(uploaded_file)
+            resume = parse_resume(uploaded_file, cache=get_default_cache())
             
             if resume is None:
                 st.error("❌ Could not parse resume. Please upload a valid PDF, DOCX, or TXT file.")
@@ -137,6 +143,10 @@ if mode == "👤 User Mode":
                 resume_skills = extract_skills(resume["text"])
                 resume["skills"] = resume_skills
                 
+                # Shared intermediates for every section below (cleaned text, keywords, skills, vectors)
+                target_jd = ROLES[role]["description"]
+                analysis = AnalysisContext(resume["text"], target_jd, resume_skills)
+                
                 # Calculate ATS Score
                 ats_result = calculate_ats_score(resume)
                 
@@ -246,17 +256,8 @@ if mode == "👤 User Mode":
                 # Job Fit Analysis
                 st.markdown("## 🎯 Job Role Fit Analysis")
                 
-                # Calculate match scores for all roles
-                scores = []
-                for r in ROLES:
-                    jd = ROLES[r]["description"]
-                    score = get_match_score(resume["text"], jd)
-                    category = get_role_category(r)
-                    scores.append({
-                        "Job Role": r,
-                        "Match %": score,
-                        "Category": category
-                    })
+                # Calculate match scores for all roles (one pass against the precompiled role index)
+                scores = role_fit_scores(resume["text"], context=analysis)
                 
                 df_roles = pd.DataFrame(scores).sort_values("Match %", ascending=False)
                 
@@ -298,8 +299,7 @@ if mode == "👤 User Mode":
                 # Skill Gap for Target Role
                 st.markdown(f"## 🔍 Skill Gap Analysis for {role}")
                 
-                target_jd = ROLES[role]["description"]
-                gap_analysis = skill_gap(resume["text"], target_jd)
+                gap_analysis = skill_gap(resume["text"], target_jd, context=analysis)
                 
                 gap_col1, gap_col2, gap_col3 = st.columns(3)
                 
@@ -378,7 +378,7 @@ if mode == "👤 User Mode":
                 # Resume Strength Analysis
                 st.markdown("## 💪 Resume Strength Analysis")
                 
-                strength = calculate_resume_strength(resume, target_jd)
+                strength = calculate_resume_strength(resume, target_jd, context=analysis)
                 
                 strength_col1, strength_col2 = st.columns([1, 2])
                 
@@ -453,7 +453,8 @@ if mode == "👤 User Mode":
                 suggestions = generate_suggestions(
                     resume["text"],
                     target_jd,
-                    gap_analysis["missing_skills"]
+                    gap_analysis["missing_skills"],
+                    context=analysis
                 )
                 
                 if suggestions:
@@ -480,57 +481,180 @@ if mode == "👤 User Mode":
 else:
     st.header("👔 HR Resume Screening & Ranking System")
     
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        role = st.selectbox(
-            "🎯 Select Job Role",
-            list(ROLES.keys()),
-            help="Choose the position you're hiring for"
-        )
+    jd_source = st.radio(
+        "Job description source",
+        ["🎯 Predefined role", "📝 Custom job description"],
+        horizontal=True
+    )
     
-    with col2:
-        st.info(f"**Category:** {get_role_category(role)}")
+    if jd_source == "🎯 Predefined role":
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            role = st.selectbox(
+                "🎯 Select Job Role",
+                list(ROLES.keys()),
+                help="Choose the position you're hiring for"
+            )
+        
+        with col2:
+            st.info(f"**Category:** {get_role_category(role)}")
+        
+        job_desc = ROLES[role]["description"]
+    else:
+        # Saved requisitions keep their analysis, so screening against one again reuses it
+        jd_library = get_jd_library()
+        saved = []
+        
+        col1, col2 = st.columns([2, 1])
+        with col2:
+            if jd_library is not None:
+                title_query = st.text_input("🔎 Search saved job descriptions", placeholder="Title contains...")
+                saved = jd_library.search(title_query)
+        with col1:
+            choice = st.selectbox(
+                "📚 Job description",
+                range(len(saved) + 1),
+                format_func=lambda i: saved[i - 1]["title"] if i else "➕ New job description"
+            )
+        
+        if choice:
+            jd_entry = saved[choice - 1]
+        else:
+            jd_title = st.text_input("Job title", placeholder="e.g. Senior Platform Engineer (REQ-1234)")
+            jd_file = st.file_uploader("📤 Upload job description", type=["pdf", "docx", "txt"])
+            jd_text = st.text_area("...or paste it here", height=200)
+            
+            if jd_file is not None:
+                jd_text = extract_resume_text(jd_file.getvalue()) or ""
+                if not jd_text.strip():
+                    st.error("❌ Could not read text from this file. Please upload a PDF, DOCX or TXT job description.")
+                jd_title = jd_title or jd_file.name
+            
+            # Drafts are screened as they are; only an explicit save adds them to the library
+            jd_entry = None
+            if jd_text.strip():
+                if jd_library is not None:
+                    jd_entry = jd_library.get(jd_fingerprint(jd_text))
+                    if jd_entry is None and st.button("💾 Save to library"):
+                        jd_entry = jd_library.add(jd_title, jd_text)
+                        st.success(f"✅ Saved \"{jd_entry['title']}\" to the job description library")
+                if jd_entry is None:
+                    jd_entry = {"title": jd_title.strip() or "Custom Role", "text": jd_text.strip()}
+        
+        if jd_entry is None:
+            role, job_desc = None, None
+            st.info("👆 Paste or upload a job description, or pick a saved one, to start screening")
+        else:
+            role = jd_entry["title"]
+            job_desc = jd_entry["text"]
+            if jd_library is not None and "fingerprint" in jd_entry:
+                job_skills = jd_library.profile(jd_entry).skills
+            else:
+                job_skills = extract_skills(job_desc)
+            st.info(f"**Category:** Custom · **Skills found:** {', '.join(sorted(job_skills)) or 'none'}")
     
     # Job Description
-    with st.expander("📄 View Job Description", expanded=False):
-        st.write(ROLES[role]["description"])
+    if job_desc:
+        with st.expander("📄 View Job Description", expanded=False):
+            st.write(job_desc)
+    
+    # Every screened resume is added to the persistent candidate index
+    candidate_index = get_candidate_index()
     
     st.markdown("---")
     
     # File Upload
     uploaded_files = st.file_uploader(
         "📤 Upload Multiple Resumes",
-        type=["pdf", "docx", "txt"],
+        type=["pdf", "docx", "txt", "zip"],
         accept_multiple_files=True,
-        help="You can upload multiple resumes at once"
+        help="You can upload multiple resumes at once, or a ZIP archive of resumes"
     )
     
-    if uploaded_files:
-        st.info(f"📊 **{len(uploaded_files)} resumes** uploaded")
+    if uploaded_files and job_desc:
+        # The screening (spooled uploads + scored candidate vectors) lives across reruns,
+        # so adding files only parses and scores the new ones
+        screening = st.session_state.get("screening")
+        upload_ids = [getattr(file, "file_id", file.name) for file in uploaded_files]
+        if screening is None or not set(screening["uploads"]) <= set(upload_ids):
+            # First upload, or files were removed: start over
+            if screening is not None:
+                screening["spool"].close()
+            screening = {
+                "spool": UploadSpool(),
+                "session": ScreeningSession(job_desc),
+                "uploads": [],
+                "processed": 0,
+                "skipped": [],
+                "items": 0,
+                "added": set()
+            }
+            st.session_state["screening"] = screening
+        spool = screening["spool"]
+        session = screening["session"]
+        
+        # A different role only re-ranks the stored vectors
+        if session.job_description != job_desc:
+            session.set_job_description(job_desc)
+        
+        # Spool just the new uploads (large ones go to temp files) and enforce the size limits
+        for file, upload_id in zip(uploaded_files, upload_ids):
+            if upload_id not in screening["uploads"]:
+                spool.add(file)
+                screening["uploads"].append(upload_id)
+        
+        # Uploads are only marked processed once the whole batch is through: a rerun
+        # (any widget change) can stop this script mid-batch, and the next run replays
+        # the unprocessed uploads (parses come from the cache, added resumes are not re-added)
+        first_new, end = screening["processed"], len(spool)
+        total_files = count_batch_files(spool)
+        new_files = count_batch_files(spool, first_new)
+        st.info(f"📊 **{total_files} resumes** uploaded")
         
         with st.spinner("🔍 Analyzing all resumes..."):
-            job_desc = ROLES[role]["description"]
-            
-            resumes = []
-            progress_bar = st.progress(0)
-            
-            for idx, file in enumerate(uploaded_files):
-                data = parse_resume(file)
-                if data:
-                    # Extract skills
-                    data["skills"] = extract_skills(data["text"])
-                    resumes.append(data)
-                
-                progress_bar.progress((idx + 1) / len(uploaded_files))
+            if first_new < end:
+                progress_bar = st.progress(0)
+                
+                # Parse + extract skills in parallel; results arrive in completion order.
+                # ZIP archives are streamed member by member into the same batch.
+                # Each resume is scored right away and only a compact record (text spooled) is kept.
+                batch_skipped = []
+                batch = parse_resumes_batch(
+                    iter_batch_items(spool, batch_skipped, first_new), cache=get_default_cache(),
+                    skipped=batch_skipped
+                )
+                first_item, items = screening["items"], 0
+                for done, (idx, data) in enumerate(batch, 1):
+                    item = first_item + idx
+                    if data and item not in screening["added"]:
+                        session.add(data, compact_record(data, spool), order=item)
+                        screening["added"].add(item)
+                        if candidate_index is not None:
+                            candidate_index.add(data)
+                    items = max(items, idx + 1)
+                    progress_bar.progress(min(done / max(new_files, 1), 1.0))
+                
+                progress_bar.empty()
+                if candidate_index is not None:
+                    candidate_index.commit()
+                
+                # Every spooled upload is now fully screened
+                screening["skipped"].extend(batch_skipped)
+                screening["items"] += items
+                screening["processed"] = end
+                screening["added"] = set()
             
-            progress_bar.empty()
+            skipped_files = list(spool.rejected) + screening["skipped"]
+            if skipped_files:
+                with st.expander(f"⚠️ {len(skipped_files)} files skipped"):
+                    st.dataframe(pd.DataFrame(skipped_files))
             
-            if not resumes:
+            if not len(session):
                 st.error("❌ Could not parse any resumes. Please check file formats.")
             else:
-                # Rank resumes
-                ranked = rank_resumes(resumes, job_desc)
+                # Rank resumes (upload order breaks ties)
+                ranked = session.ranked()
                 
                 st.success(f"✅ Successfully analyzed {len(ranked)} resumes")
                 
@@ -600,6 +724,96 @@ else:
                 fig_dist.update_layout(showlegend=False, height=400)
                 st.plotly_chart(fig_dist, width="stretch")
                 
+                # Every candidate against every role
+                st.markdown("## 🧭 Best Role per Candidate")
+                
+                role_fit = session.cross_match()
+                best_roles = role_fit.top_k(3)
+                st.dataframe(pd.DataFrame([
+                    {
+                        "Name": r["name"],
+                        "Best Role": roles[0][0],
+                        "Best Role Match": f"{roles[0][1]:.1f}%",
+                        "Runners-up": ", ".join(f"{name} ({score:.1f}%)" for name, score in roles[1:])
+                    }
+                    for r, roles in zip(ranked, best_roles)
+                ]), height=300)
+                
+                heatmap_rows = min(len(ranked), 30)
+                fig_fit = px.imshow(
+                    role_fit.scores[:heatmap_rows],
+                    x=role_fit.labels,
+                    y=[f"#{i} {r['name']}" for i, r in enumerate(ranked[:heatmap_rows], 1)],
+                    color_continuous_scale="Blues",
+                    zmin=0,
+                    zmax=100,
+                    aspect="auto",
+                    labels={'x': 'Job Role', 'y': 'Candidate', 'color': 'Match %'},
+                    title=f'Role Fit of the Top {heatmap_rows} Candidates'
+                )
+                fig_fit.update_layout(height=max(400, 22 * heatmap_rows))
+                st.plotly_chart(fig_fit, width="stretch")
+                
+                # Skill filters over the whole pool (candidates x skills bit matrix)
+                st.markdown("## 🎯 Filter Candidates by Skills")
+                
+                skill_matrix = SkillMatrix(r.get("skills") for r in ranked)
+                job_skills = session.job_skills
+                pool_gap = skill_matrix.gap(job_skills)
+                coverage = skill_matrix.coverage()
+                skill_options = sorted((s for s in skill_matrix.skills if coverage[s]), key=lambda s: (-coverage[s], s))
+                
+                filter_col1, filter_col2, filter_col3 = st.columns(3)
+                with filter_col1:
+                    must_have = st.multiselect("Must have all of", skill_options, key="filter_all")
+                with filter_col2:
+                    any_of = st.multiselect("Has at least one of", skill_options, key="filter_any")
+                with filter_col3:
+                    exclude = st.multiselect("Must not have", skill_options, key="filter_none")
+                
+                category_col1, category_col2 = st.columns(2)
+                with category_col1:
+                    category = st.selectbox("Category", ["Any"] + list(skill_matrix.category_masks), key="filter_category")
+                with category_col2:
+                    min_in_category = st.number_input("Minimum skills in category", 0, 20, 1, key="filter_category_min")
+                
+                keep = skill_matrix.filter(
+                    all_of=must_have,
+                    any_of=any_of,
+                    none_of=exclude,
+                    min_in_category={category: min_in_category} if category != "Any" else None
+                )
+                st.caption(f"{int(keep.sum())} of {len(ranked)} candidates match the filters")
+                
+                filtered = [
+                    {
+                        "Rank": i + 1,
+                        "Name": ranked[i]["name"],
+                        "Match Score": f"{ranked[i]['score']:.1f}%",
+                        "Role Skills": f"{pool_gap['matched'][i]}/{len(job_skills)}",
+                        "Skill Match": f"{pool_gap['match_percentage'][i]:.1f}%"
+                    }
+                    for i in keep.nonzero()[0].tolist()
+                ]
+                if filtered:
+                    st.dataframe(pd.DataFrame(filtered), height=300)
+                
+                if job_skills:
+                    missing_coverage = pool_gap["missing_coverage"]
+                    gap_df = pd.DataFrame({
+                        "Skill": list(missing_coverage),
+                        "Candidates Missing": list(missing_coverage.values())
+                    }).sort_values("Candidates Missing", ascending=False)
+                    fig_gap = px.bar(
+                        gap_df,
+                        x="Skill",
+                        y="Candidates Missing",
+                        title=f"Pool Skill Gap for {role}",
+                        color_discrete_sequence=['#d62728']
+                    )
+                    fig_gap.update_layout(height=400)
+                    st.plotly_chart(fig_gap, width="stretch")
+                
                 # Top Candidates Detail
                 st.markdown("## 🌟 Top 3 Candidates Analysis")
                 
@@ -624,6 +838,10 @@ else:
                                 st.markdown("**Missing Keywords:**")
                                 for kw in candidate["missing_keywords"][:3]:
                                     st.warning(f"⚠ {kw}")
+                        
+                        # Full text is only read back from the spool for displayed candidates
+                        if st.checkbox("📄 Show resume text", key=f"show_text_{idx}"):
+                            st.text(spool.load_text(candidate["text_key"]))
                 
                 st.markdown("---")
                 
@@ -659,6 +877,33 @@ else:
                         file_name=f"{role.replace(' ', '_')}_ranking.csv",
                         mime="text/csv"
                     )
+    
+    # Search everyone screened so far, without re-reading any resumes
+    if candidate_index is not None and len(candidate_index):
+        st.markdown("---")
+        st.markdown("## 🗂️ Search All Screened Candidates")
+        st.caption(f"{len(candidate_index):,} candidates indexed")
+        
+        index_query = st.text_area(
+            "Job description to search for",
+            value=job_desc or "",
+            help="Defaults to the selected job description"
+        )
+        top_k = st.slider("Candidates to show", 5, 50, 10)
+        
+        matches = candidate_index.search(index_query, k=top_k)
+        if matches:
+            st.dataframe(pd.DataFrame([{
+                "Rank": rank,
+                "Name": m["name"],
+                "Email": m["email"],
+                "Experience": m.get("experience_years", "N/A"),
+                "Education": m.get("education", "N/A"),
+                "Relevance": m["score"],
+                "Matched Skills": ", ".join(m["matched_skills"])
+            } for rank, m in enumerate(matches, 1)]))
+        else:
+            st.info("No indexed candidates match this job description")
 
 # Footer
 st.markdown("---")
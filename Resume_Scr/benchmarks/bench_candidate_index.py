@@ -0,0 +1,80 @@
+"""
+Benchmark the persistent candidate index: build time, on-disk size and query latency.
+
+Builds an index of synthetic resumes in a temp directory (or at --path), then
+times search() for every role in roles.py.
+
+Usage:
+    python benchmarks/bench_candidate_index.py [--docs 40000] [--batch 5000] [--k 10]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from candidate_index import CandidateIndex
+from roles import ROLES
+
+FILLER = ("led team delivered project improved performance designed built maintained "
+          "stakeholders reporting production customers migrated automated tested").split()
+
+
+def synthetic_candidate(rng, i):
+    """A parse_resume()-shaped record with resume-like text"""
+    role_words = rng.choice(list(ROLES.values()))["description"].split()
+    words = role_words * rng.randint(1, 4) + rng.choices(FILLER, k=rng.randint(100, 500))
+    rng.shuffle(words)
+    return {
+        "name": f"Candidate {i}",
+        "email": f"candidate{i}@example.com",
+        "phone": "Not Found",
+        "experience_years": rng.randint(0, 15),
+        "education": "Bachelor's",
+        "text": " ".join(words) + f" ref{i}",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report candidate index build and query times")
+    parser.add_argument("--docs", type=int, default=40000)
+    parser.add_argument("--batch", type=int, default=5000, help="documents per commit")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--path", help="index directory (default: a temp directory)")
+    args = parser.parse_args()
+
+    path = args.path or tempfile.mkdtemp(prefix="candidate_index_")
+    rng = random.Random(0)
+    index = CandidateIndex(path)
+
+    start = time.perf_counter()
+    for i in range(args.docs):
+        index.add(synthetic_candidate(rng, i))
+        if (i + 1) % args.batch == 0:
+            index.commit()
+    index.commit()
+    build = time.perf_counter() - start
+    size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+    print(f"built {len(index)} candidates in {build:.1f}s ({size / 1e6:.1f} MB on disk) at {path}")
+
+    # Reopen so queries run against the memory-mapped files
+    index.close()
+    start = time.perf_counter()
+    index = CandidateIndex(path)
+    print(f"opened in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    timings = []
+    for role in ROLES:
+        start = time.perf_counter()
+        index.search(role, k=args.k)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    print(f"{len(timings)} queries: median {timings[len(timings) // 2]:.2f} ms, max {timings[-1]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark cross matching: every resume against every role in roles.py.
+
+Compares cross_match() with calling get_match_score for each (resume, role)
+pair, and reports peak memory growth of cross_match at each size.
+
+Usage:
+    python benchmarks/bench_cross_match.py [--sizes 10 100 1000 10000] [--max-loop 100] [--chunk 500]
+"""
+
+import argparse
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_rank_resumes import synthetic_resumes
+from nlp_engine import cross_match, get_match_score
+from roles import ROLES
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report resumes x roles cross-match throughput")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--max-loop", type=int, default=100,
+                        help="largest size to run the per-pair loop on (it is slow)")
+    parser.add_argument("--chunk", type=int, default=500)
+    args = parser.parse_args()
+
+    corpus = synthetic_resumes(max(args.sizes))
+    jds = [d["description"] for d in ROLES.values()]
+
+    print(f"{'resumes':>8} {'pairs':>9} {'loop s':>10} {'cross s':>10} {'speedup':>8} {'RSS growth':>11}")
+    for size in args.sizes:
+        texts = corpus[:size]
+        before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        cross_match(texts, chunk_size=args.chunk)
+        cross = time.perf_counter() - start
+        growth_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before_kb) / 1024
+        pairs = size * len(jds)
+        if size <= args.max_loop:
+            start = time.perf_counter()
+            for text in texts:
+                for jd in jds:
+                    get_match_score(text, jd)
+            loop = time.perf_counter() - start
+            print(f"{size:>8} {pairs:>9} {loop:>10.3f} {cross:>10.3f} {loop / cross:>7.1f}x {growth_mb:>8.1f} MB")
+        else:
+            print(f"{size:>8} {pairs:>9} {'-':>10} {cross:>10.3f} {'-':>8} {growth_mb:>8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
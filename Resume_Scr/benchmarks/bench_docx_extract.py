@@ -0,0 +1,90 @@
+"""
+Benchmark DOCX text extraction: streaming iterparse reader vs python-docx DOM.
+
+Each method runs in a fresh process so peak RSS is measured in isolation.
+
+Usage:
+    python benchmarks/bench_docx_extract.py resume1.docx resume2.docx [--repeat 5]
+    python benchmarks/bench_docx_extract.py --synthetic 20000
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+METHODS = {
+    "streaming": "extract_text_from_docx",
+    "python-docx": "_extract_text_from_docx_dom",
+}
+
+
+def _measure(method, paths, repeat, queue):
+    """Run one extractor over the corpus and report time and peak RSS growth"""
+    import resume_parser
+
+    extract = getattr(resume_parser, METHODS[method])
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    chars = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in paths:
+            chars += len(extract(path))
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, peak_kb - baseline_kb, chars // repeat))
+
+
+def make_synthetic_docx(paragraphs):
+    """Write a large templated CV (paragraphs + a skills table) to a temp file"""
+    import docx
+
+    doc = docx.Document()
+    table = doc.add_table(rows=paragraphs // 20, cols=2)
+    for i, row in enumerate(table.rows):
+        row.cells[0].text = f"Skill group {i}"
+        row.cells[1].text = "python, sql, docker, kubernetes, aws"
+    for i in range(paragraphs):
+        doc.add_paragraph(f"Led project {i} delivering data pipelines with Spark and Kafka for 3x throughput.")
+    handle, path = tempfile.mkstemp(suffix=".docx")
+    os.close(handle)
+    doc.save(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare DOCX extractors for speed and peak RSS")
+    parser.add_argument("docx", nargs="*", help="sample DOCX files")
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the corpus")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="also benchmark a generated DOCX with this many paragraphs")
+    args = parser.parse_args()
+
+    paths = list(args.docx)
+    if args.synthetic:
+        paths.append(make_synthetic_docx(args.synthetic))
+    if not paths:
+        parser.error("give DOCX files and/or --synthetic N")
+
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'method':<12} {'seconds':>10} {'docs/sec':>10} {'peak RSS +MB':>13} {'chars/pass':>12}")
+    for method in METHODS:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_measure, args=(method, paths, args.repeat, queue))
+        proc.start()
+        elapsed, rss_kb, chars = queue.get()
+        proc.join()
+        docs_per_sec = len(paths) * args.repeat / elapsed if elapsed > 0 else 0.0
+        print(f"{method:<12} {elapsed:>10.3f} {docs_per_sec:>10.1f} {rss_kb / 1024:>13.1f} {chars:>12}")
+
+    if args.synthetic:
+        os.remove(paths[-1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark out-of-core hashed scoring: throughput and peak memory vs stream length.
+
+Each stream length runs in a fresh process, so peak RSS is measured in isolation
+and should stay flat as the number of resumes grows.
+
+Usage:
+    python benchmarks/bench_hashed_scoring.py [--sizes 1000 10000 100000] [--chunk 1000] [--k 10]
+    python benchmarks/bench_hashed_scoring.py --paths resumes/ archive.zip
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FILLER = ("led team delivered project improved performance designed built maintained "
+          "stakeholders reporting production customers migrated automated tested").split()
+
+
+def synthetic_stream(count, seed=0):
+    """Lazily generated (key, text) resume-like pairs"""
+    from roles import ROLES
+
+    rng = random.Random(seed)
+    role_words = [d["description"].split() for d in ROLES.values()]
+    for i in range(count):
+        words = rng.choice(role_words) * rng.randint(1, 4) + rng.choices(FILLER, k=rng.randint(100, 500))
+        rng.shuffle(words)
+        yield f"resume-{i}", " ".join(words) + f" ref{i}"
+
+
+def _measure(size, paths, chunk, k, queue):
+    from nlp_engine import stream_top_k
+    from roles import ROLES
+
+    if paths:
+        from ingest import iter_resume_texts
+        items = iter_resume_texts(paths)
+    else:
+        items = synthetic_stream(size)
+    job_description = next(iter(ROLES.values()))["description"]
+
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    counted = [0]
+
+    def counting(stream):
+        for item in stream:
+            counted[0] += 1
+            yield item
+
+    start = time.perf_counter()
+    stream_top_k(counting(items), job_description, k=k, chunk_size=chunk)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((counted[0], elapsed, peak_kb - baseline_kb))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report hashed-scoring throughput and memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--chunk", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--paths", nargs="*", help="resume files, directories or ZIP archives to stream instead")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    sizes = [None] if args.paths else args.sizes
+    print(f"{'resumes':>10} {'seconds':>10} {'resumes/s':>10} {'peak RSS growth':>16}")
+    for size in sizes:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_measure, args=(size, args.paths, args.chunk, args.k, queue))
+        proc.start()
+        count, elapsed, growth_kb = queue.get()
+        proc.join()
+        print(f"{count:>10} {elapsed:>10.2f} {count / elapsed:>10.0f} {growth_kb / 1024:>13.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
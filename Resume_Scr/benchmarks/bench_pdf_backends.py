@@ -0,0 +1,31 @@
+"""
+Benchmark PDF text backends on a sample corpus.
+
+Usage:
+    python benchmarks/bench_pdf_backends.py path/to/resumes/*.pdf [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_parser import benchmark_pdf_backends
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report pages/sec for each PDF text backend")
+    parser.add_argument("pdfs", nargs="+", help="sample PDF files")
+    parser.add_argument("--repeat", type=int, default=1, help="passes over the corpus")
+    args = parser.parse_args()
+
+    results = benchmark_pdf_backends(args.pdfs, repeat=args.repeat)
+
+    print(f"{'backend':<12} {'pages':>8} {'seconds':>10} {'pages/sec':>10}")
+    for backend, r in sorted(results.items(), key=lambda x: -x[1]["pages_per_sec"]):
+        print(f"{backend:<12} {r['pages']:>8} {r['seconds']:>10.3f} {r['pages_per_sec']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark resume ranking: per-resume get_detailed_match_score vs the batch engine,
+plus rank_resumes(top_k=...) which only builds entries for the best candidates.
+
+Resumes are synthesized from the role descriptions in roles.py (or read from
+text files) and ranked against one role's description at growing batch sizes.
+
+Usage:
+    python benchmarks/bench_rank_resumes.py [--sizes 10 100 1000 10000] [--max-loop 1000] [--top-k 10]
+    python benchmarks/bench_rank_resumes.py --texts path/to/resumes/*.txt
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlp_engine import batch_match_details, get_detailed_match_score, rank_resumes
+from roles import ROLES
+
+FILLER = ("led team delivered project improved performance designed built maintained "
+          "stakeholders reporting production customers migrated automated tested").split()
+
+
+def synthetic_resumes(count, seed=0):
+    """Resume-like texts mixing role vocabulary and filler words"""
+    rng = random.Random(seed)
+    role_words = [d["description"].split() for d in ROLES.values()]
+    texts = []
+    for _ in range(count):
+        words = rng.choice(role_words) * rng.randint(2, 6) + rng.choices(FILLER, k=rng.randint(100, 600))
+        rng.shuffle(words)
+        texts.append(" ".join(words))
+    return texts
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report ranking throughput per batch size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--max-loop", type=int, default=1000,
+                        help="largest size to run the per-resume loop on (it is slow)")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--texts", nargs="*", help="resume .txt files to cycle through instead of synthetic ones")
+    args = parser.parse_args()
+
+    job_description = next(iter(ROLES.values()))["description"]
+    if args.texts:
+        corpus = []
+        for path in args.texts:
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                corpus.append(f.read())
+    else:
+        corpus = synthetic_resumes(max(args.sizes))
+
+    top_label = f"top{args.top_k} s"
+    print(f"{'resumes':>8} {'loop s':>10} {'batch s':>10} {top_label:>10} {'speedup':>8} {'resumes/s':>10}")
+    for size in args.sizes:
+        texts = [corpus[i % len(corpus)] for i in range(size)]
+        resumes = [{"name": f"Candidate {i}", "text": t} for i, t in enumerate(texts)]
+        batch = _time(lambda: batch_match_details(texts, job_description))
+        top = _time(lambda: [r["matched_keywords"] for r in rank_resumes(resumes, job_description, top_k=args.top_k)])
+        if size <= args.max_loop:
+            loop = _time(lambda: [get_detailed_match_score(t, job_description) for t in texts])
+            print(f"{size:>8} {loop:>10.3f} {batch:>10.3f} {top:>10.3f} {loop / batch:>7.1f}x {size / batch:>10.0f}")
+        else:
+            print(f"{size:>8} {'-':>10} {batch:>10.3f} {top:>10.3f} {'-':>8} {size / batch:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark the candidates x skills bit matrix: build time and query latency.
+
+Candidates get random skill sets drawn from the taxonomy; the same filter and
+gap queries are also run as Python loops over the skill lists for comparison.
+
+Usage:
+    python benchmarks/bench_skill_matrix.py [--candidates 1000 10000 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_matrix import SkillMatrix
+from skills import ALL_SKILLS
+
+JOB_SKILLS = ["python", "sql", "aws", "docker", "tableau"]
+
+
+def _ms(fn, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report skill matrix build and query times")
+    parser.add_argument("--candidates", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'candidates':>10} {'build ms':>9} {'filter ms':>10} {'loop ms':>8} {'gap ms':>7} {'loop ms':>8}")
+    for n in args.candidates:
+        pool = [rng.sample(ALL_SKILLS, rng.randint(0, 25)) for _ in range(n)]
+        build = _ms(lambda: SkillMatrix(pool), repeat=1)
+        matrix = SkillMatrix(pool)
+
+        query = _ms(lambda: matrix.filter(all_of=["python", "aws"], none_of=["java"]))
+        query_loop = _ms(lambda: [("python" in s and "aws" in s and "java" not in s) for s in pool])
+        gap = _ms(lambda: matrix.gap(JOB_SKILLS))
+        gap_loop = _ms(lambda: [len(set(JOB_SKILLS) & set(s)) for s in pool])
+        print(f"{n:>10} {build:>9.1f} {query:>10.2f} {query_loop:>8.2f} {gap:>7.2f} {gap_loop:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+import glob
+import json
+import math
+import mmap
+import os
+import threading
+
+import numpy as np
+from scipy import sparse
+
+from nlp_engine import tokenize, text_fingerprint, job_tokens, job_skills
+from roles import ROLES
+from skills import extract_skills
+
+# Where the index lives (a directory of .npy arrays plus JSON metadata)
+CANDIDATE_INDEX_PATH = os.environ.get(
+    "RESUME_CANDIDATE_INDEX",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "candidate_index")
+)
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Parsed fields kept per candidate (the resume text itself is not stored)
+INDEX_FIELDS = [
+    "name", "email", "phone", "experience_years", "education",
+    "universities", "certifications", "project_count", "skills"
+]
+
+
+# -------- Candidate Index --------
+class CandidateIndex:
+    """Persistent BM25 index over every resume screened so far.
+
+    Layout of the index directory (one generation of arrays is live at a time):
+      meta.json              - document/term counts, total length, live generation
+      terms.json             - term list; a term's position is its ID
+      indptr-<gen>.npy       - postings offsets per term ID
+      docs-<gen>.npy         - document IDs of each posting (int32, sorted per term)
+      tf-<gen>.npy           - term frequency of each posting (float32)
+      doc_len-<gen>.npy      - indexed terms per document (float32)
+      offsets-<gen>.npy      - byte offset of each document's record in candidates.jsonl
+      candidates.jsonl       - parsed fields and skills, one JSON record per line
+
+    The arrays are memory-mapped on open, so searching reads only the postings
+    of the query terms and the records of the returned candidates. add() stages
+    documents (deduplicated by text fingerprint) and commit() merges them into
+    a new generation that replaces the old one. A single writer is assumed.
+    """
+
+    def __init__(self, path=CANDIDATE_INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = []
+        self._keys = None
+        self._records = None
+        os.makedirs(path, exist_ok=True)
+        self._load()
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _load(self):
+        """Memory-map the live generation (or start empty)"""
+        if self._records is not None:
+            self._records.close()
+            self._records = None
+        try:
+            with open(self._file("meta.json"), encoding="utf-8") as f:
+                self.meta = json.load(f)
+            with open(self._file("terms.json"), encoding="utf-8") as f:
+                self.terms = json.load(f)
+        except (OSError, ValueError):
+            self.meta = {"generation": 0, "documents": 0, "total_length": 0.0, "records_bytes": 0}
+            self.terms = []
+        self.term_ids = {t: i for i, t in enumerate(self.terms)}
+
+        gen = self.meta["generation"]
+        if gen:
+            load = lambda name: np.load(self._file(f"{name}-{gen}.npy"), mmap_mode="r")
+            self.indptr = load("indptr")
+            self.docs = load("docs")
+            self.tf = load("tf")
+            self.doc_len = load("doc_len")
+            self.offsets = load("offsets")
+        else:
+            self.indptr = np.zeros(1, dtype=np.int64)
+            self.docs = np.zeros(0, dtype=np.int32)
+            self.tf = np.zeros(0, dtype=np.float32)
+            self.doc_len = np.zeros(0, dtype=np.float32)
+            self.offsets = np.zeros(0, dtype=np.int64)
+        if self.meta["records_bytes"]:
+            with open(self._file("candidates.jsonl"), "rb") as f:
+                self._records = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return self.meta["documents"]
+
+    # -------- Adding candidates --------
+    def _known_keys(self):
+        """Fingerprints of indexed documents (read from the records on first use)"""
+        if self._keys is None:
+            self._keys = set()
+            for i in range(len(self)):
+                self._keys.add(self._record(i)["key"])
+        return self._keys
+
+    def add(self, data):
+        """Stage one parse_resume() result; returns False if it is already indexed"""
+        key = text_fingerprint(data["text"])
+        with self._lock:
+            if key in self._known_keys():
+                return False
+            self._known_keys().add(key)
+
+        tokens = tokenize(data["text"])
+        terms, counts = tokens.keyword_counts()
+        record = {field: data.get(field) for field in INDEX_FIELDS}
+        if record["skills"] is None:
+            record["skills"] = extract_skills(data["text"])
+        record["key"] = key
+
+        with self._lock:
+            self._pending.append((record, list(terms), counts.astype(np.float32)))
+        return True
+
+    def commit(self):
+        """Merge staged documents into a new generation of the on-disk index"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, []
+
+            # Staged documents as a (new docs x terms) matrix; unseen terms get new IDs
+            indptr, indices, data, lengths = [0], [], [], []
+            for _, terms, counts in pending:
+                for term in terms:
+                    if term not in self.term_ids:
+                        self.term_ids[term] = len(self.terms)
+                        self.terms.append(term)
+                    indices.append(self.term_ids[term])
+                data.extend(counts.tolist())
+                indptr.append(len(indices))
+                lengths.append(float(counts.sum()))
+
+            n_old, n_new, n_terms = len(self), len(pending), len(self.terms)
+            new = sparse.csr_matrix(
+                (np.array(data, dtype=np.float32), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+                shape=(n_new, n_terms)
+            )
+            old = sparse.csr_matrix(
+                (np.asarray(self.tf), np.asarray(self.docs), np.asarray(self.indptr)),
+                shape=(len(self.indptr) - 1, n_old)
+            )
+            old.resize((n_terms, n_old))
+            postings = sparse.hstack([old, new.T.tocsr()], format="csr")
+            postings.sort_indices()
+
+            # Records are appended after the last committed byte (drops a torn earlier write)
+            if self._records is not None:
+                self._records.close()
+                self._records = None
+            records_bytes = self.meta["records_bytes"]
+            mode = "r+b" if os.path.exists(self._file("candidates.jsonl")) else "wb"
+            new_offsets = []
+            with open(self._file("candidates.jsonl"), mode) as f:
+                f.truncate(records_bytes)
+                f.seek(records_bytes)
+                for record, _, _ in pending:
+                    new_offsets.append(f.tell())
+                    f.write(json.dumps(record).encode("utf-8") + b"\n")
+                records_bytes = f.tell()
+
+            gen = self.meta["generation"] + 1
+            arrays = {
+                "indptr": postings.indptr.astype(np.int64),
+                "docs": postings.indices.astype(np.int32),
+                "tf": postings.data.astype(np.float32),
+                "doc_len": np.concatenate([np.asarray(self.doc_len), np.array(lengths, dtype=np.float32)]),
+                "offsets": np.concatenate([np.asarray(self.offsets), np.array(new_offsets, dtype=np.int64)]),
+            }
+            for name, array in arrays.items():
+                np.save(self._file(f"{name}-{gen}.npy"), array)
+
+            _write_json(self._file("terms.json"), self.terms)
+            _write_json(self._file("meta.json"), {
+                "generation": gen,
+                "documents": n_old + n_new,
+                "total_length": self.meta["total_length"] + sum(lengths),
+                "records_bytes": records_bytes
+            })
+            self._load()
+            self._remove_stale_generations(gen)
+            return n_new
+
+    def _remove_stale_generations(self, live):
+        for path in glob.glob(self._file("*-*.npy")):
+            gen = os.path.basename(path).rsplit("-", 1)[1][:-len(".npy")]
+            if gen != str(live):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def close(self):
+        with self._lock:
+            if self._records is not None:
+                self._records.close()
+                self._records = None
+
+    # -------- Search --------
+    def _record(self, doc):
+        """Parsed fields of one indexed document, read from the memory-mapped records file.
+
+        Callers hold self._lock: commit() closes and re-maps the records file.
+        """
+        start = int(self.offsets[doc])
+        end = self._records.find(b"\n", start)
+        return json.loads(self._records[start:end])
+
+    def scores(self, job_description):
+        """BM25 score of every indexed candidate for a job description"""
+        with self._lock:
+            n_docs = len(self)
+            scores = np.zeros(n_docs, dtype=np.float64)
+            if n_docs == 0:
+                return scores
+            avg_len = self.meta["total_length"] / n_docs or 1.0
+            terms, _ = job_tokens(job_description)[0].keyword_counts()
+            for term in terms:
+                t = self.term_ids.get(term)
+                if t is None or t + 1 >= len(self.indptr):
+                    continue
+                start, end = int(self.indptr[t]), int(self.indptr[t + 1])
+                if start == end:
+                    continue
+                docs = self.docs[start:end]
+                tf = self.tf[start:end].astype(np.float64)
+                df = end - start
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_len[docs] / avg_len)
+                scores[docs] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+            return scores
+
+    def search(self, query, k=10):
+        """Top-k indexed candidates for a job description or a roles.ROLES key.
+
+        Returns the stored fields of each candidate plus its BM25 "score" and the
+        "matched_skills" it shares with the job description, best first.
+        """
+        job_description = ROLES[query]["description"] if query in ROLES else query
+        scores = self.scores(job_description)
+        if len(scores) == 0:
+            return []
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+
+        required_skills = set(job_skills(job_description))
+        results = []
+        with self._lock:
+            # Document IDs survive commits (documents are only appended), so the scores stay valid
+            for doc in top.tolist():
+                if scores[doc] <= 0:
+                    break
+                record = self._record(doc)
+                record.pop("key", None)
+                record["score"] = round(float(scores[doc]), 2)
+                record["matched_skills"] = sorted(required_skills & set(record.get("skills") or []))
+                results.append(record)
+        return results
+
+
+def _write_json(path, value):
+    """Write JSON atomically (temp file + rename)"""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(value, f)
+    os.replace(tmp, path)
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_candidate_index():
+    """Process-wide CandidateIndex at CANDIDATE_INDEX_PATH (None if it can't be opened)"""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            try:
+                _default_index = CandidateIndex()
+            except (OSError, ValueError) as e:
+                print(f"Candidate index disabled: {e}")
+                return None
+        return _default_index
@@ -0,0 +1,212 @@
+import os
+import tempfile
+import zipfile
+
+from resume_parser import iter_zip_members, extract_resume_text
+
+# Uploads larger than this are spooled to a temp file instead of kept in memory
+SPOOL_THRESHOLD_BYTES = int(os.environ.get("RESUME_SPOOL_THRESHOLD", 1024 * 1024))
+
+# Per-file, per-archive and per-batch upload limits (the per-file limit covers
+# single resumes; ZIP members are capped by resume_parser.ZIP_MAX_MEMBER_BYTES)
+MAX_FILE_BYTES = int(os.environ.get("RESUME_MAX_FILE_BYTES", 20 * 1024 * 1024))
+MAX_ARCHIVE_BYTES = int(os.environ.get("RESUME_MAX_ARCHIVE_BYTES", 500 * 1024 * 1024))
+MAX_BATCH_BYTES = int(os.environ.get("RESUME_MAX_BATCH_BYTES", 500 * 1024 * 1024))
+
+COPY_CHUNK_BYTES = 256 * 1024
+
+
+# -------- Upload Spool --------
+class UploadSpool:
+    """Bounded-memory holding area for one screening batch.
+
+    Uploads are copied chunk by chunk into SpooledTemporaryFiles, which stay
+    in memory below `threshold` bytes and roll over to disk above it. ZIP
+    archives are held to the archive limit and every other upload to the
+    per-file limit; anything breaking those or the batch limit is rejected
+    (see `rejected`). Extracted resume texts are spooled the same way, so a
+    candidate only needs a small text key until its details are displayed.
+    """
+
+    def __init__(self, threshold=SPOOL_THRESHOLD_BYTES, max_file_bytes=MAX_FILE_BYTES,
+                 max_batch_bytes=MAX_BATCH_BYTES, max_archive_bytes=MAX_ARCHIVE_BYTES):
+        self.threshold = threshold
+        self.max_file_bytes = max_file_bytes
+        self.max_archive_bytes = max_archive_bytes
+        self.max_batch_bytes = max_batch_bytes
+        self.total_bytes = 0
+        self.rejected = []
+        self._files = []
+        self._texts = []
+
+    def add(self, file):
+        """Spool an uploaded file; returns False (and records why) if it breaks a limit"""
+        name = getattr(file, "name", "upload")
+        size = getattr(file, "size", None)
+        # Whether it is an archive is only known once spooled, so copy up to the larger limit
+        max_bytes = max(self.max_file_bytes, self.max_archive_bytes)
+        if size is not None and size > max_bytes:
+            return self._reject(name, f"larger than the {max_bytes:,} byte upload limit")
+        if size is not None and self.total_bytes + size > self.max_batch_bytes:
+            return self._reject(name, f"over the {self.max_batch_bytes:,} byte batch limit")
+
+        buffer = tempfile.SpooledTemporaryFile(max_size=self.threshold)
+        copied = 0
+        file.seek(0)
+        while True:
+            chunk = file.read(COPY_CHUNK_BYTES)
+            if not chunk:
+                break
+            copied += len(chunk)
+            if copied > max_bytes or self.total_bytes + copied > self.max_batch_bytes:
+                buffer.close()
+                return self._reject(name, "exceeds the upload size limits")
+            buffer.write(chunk)
+        file.seek(0)
+
+        buffer.seek(0)
+        archive = is_archive(buffer)
+        if archive and copied > self.max_archive_bytes:
+            buffer.close()
+            return self._reject(name, f"larger than the {self.max_archive_bytes:,} byte archive limit")
+        if not archive and copied > self.max_file_bytes:
+            buffer.close()
+            return self._reject(name, f"larger than the {self.max_file_bytes:,} byte file limit")
+
+        self.total_bytes += copied
+        self._files.append((name, buffer, archive))
+        return True
+
+    def _reject(self, name, reason):
+        self.rejected.append({"name": name, "reason": reason})
+        return False
+
+    def __len__(self):
+        return len(self._files)
+
+    def files(self, start=0):
+        """Yield (name, file, is_archive) for every spooled upload from position `start`, rewound to the start"""
+        for name, buffer, archive in self._files[start:]:
+            buffer.seek(0)
+            yield name, buffer, archive
+
+    # -------- Spooled Texts --------
+    def store_text(self, text):
+        """Spool an extracted resume text and return its key"""
+        buffer = tempfile.SpooledTemporaryFile(max_size=self.threshold, mode="w+", encoding="utf-8")
+        buffer.write(text)
+        self._texts.append(buffer)
+        return len(self._texts) - 1
+
+    def load_text(self, key):
+        """Read a spooled resume text back"""
+        buffer = self._texts[key]
+        buffer.seek(0)
+        return buffer.read()
+
+    def close(self):
+        for _, buffer, _ in self._files:
+            buffer.close()
+        for buffer in self._texts:
+            buffer.close()
+        self._files = []
+        self._texts = []
+
+
+# -------- Batch Feeding --------
+def is_archive(buffer):
+    """True for a ZIP of resumes (a DOCX is also a ZIP, but not an archive of files)"""
+    if not zipfile.is_zipfile(buffer):
+        buffer.seek(0)
+        return False
+    buffer.seek(0)
+    with zipfile.ZipFile(buffer) as archive:
+        is_docx = "word/document.xml" in archive.namelist()
+    buffer.seek(0)
+    return not is_docx
+
+
+def archive_member_count(buffer):
+    """Number of file entries in a spooled ZIP archive (read from its central directory)"""
+    with zipfile.ZipFile(buffer) as archive:
+        count = sum(1 for info in archive.infolist() if not info.is_dir())
+    buffer.seek(0)
+    return count
+
+
+def count_batch_files(spool, start=0):
+    """Number of resumes a spool will feed (ZIP archives counted by member)"""
+    return sum(archive_member_count(buffer) if archive else 1 for _, buffer, archive in spool.files(start))
+
+
+def iter_batch_items(spool, skipped=None, start=0):
+    """Yield (name, bytes) for every resume in the spool, one at a time.
+
+    ZIP archives are expanded member by member via iter_zip_members, whose
+    skipped members are appended to `skipped`. Uploads before position
+    `start` are left out (already screened). Feed this to
+    resume_parser.parse_resumes_batch.
+    """
+    for name, buffer, archive in spool.files(start):
+        if archive:
+            yield from iter_zip_members(buffer, skipped, name=name)
+        else:
+            yield name, buffer.read()
+
+
+# -------- Streaming From Disk --------
+def iter_resume_files(paths, skipped=None):
+    """Yield (name, bytes) for every resume under `paths` (files, directories, ZIP archives).
+
+    Directories are walked recursively and archives expanded member by member,
+    so only one file's bytes are held at a time.
+    """
+    skipped = skipped if skipped is not None else []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                yield from iter_resume_files(
+                    (os.path.join(root, n) for n in sorted(names) if not n.startswith(".")), skipped
+                )
+            continue
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if is_archive(f):
+                    if size > MAX_ARCHIVE_BYTES:
+                        skipped.append({"name": path, "reason": f"larger than the {MAX_ARCHIVE_BYTES:,} byte archive limit"})
+                        continue
+                    yield from iter_zip_members(f, skipped, name=path)
+                    continue
+                if size > MAX_FILE_BYTES:
+                    skipped.append({"name": path, "reason": f"larger than the {MAX_FILE_BYTES:,} byte file limit"})
+                    continue
+                content = f.read()
+        except OSError as e:
+            skipped.append({"name": path, "reason": f"unreadable ({e})"})
+            continue
+        yield path, content
+
+
+def iter_resume_texts(paths, skipped=None):
+    """Yield (name, text) for every resume under `paths`; feed to nlp_engine.stream_top_k"""
+    skipped = skipped if skipped is not None else []
+    for name, content in iter_resume_files(paths, skipped):
+        text = extract_resume_text(content)
+        if text is None:
+            skipped.append({"name": name, "reason": "unsupported file type"})
+        else:
+            yield name, text
+
+
+# -------- Compact Candidate Records --------
+def compact_record(data, spool):
+    """Drop the full text (and section offsets) from a parsed resume after feature extraction.
+
+    The text is moved into the spool and replaced by a "text_key"; use
+    spool.load_text(record["text_key"]) to get it back for display.
+    """
+    record = {k: v for k, v in data.items() if k not in ("text", "sections")}
+    record["text_key"] = spool.store_text(data["text"])
+    return record
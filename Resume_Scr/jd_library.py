@@ -0,0 +1,198 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from nlp_engine import text_fingerprint
+from resume_parser import extract_resume_text
+from roles import RoleProfile, register_profile
+from skills import get_taxonomy
+
+# Where saved job descriptions live
+JD_LIBRARY_PATH = os.environ.get(
+    "RESUME_JD_LIBRARY",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "jd_library.sqlite3")
+)
+
+# Category shown for job descriptions that are not in roles.ROLES
+CUSTOM_CATEGORY = "Custom"
+
+
+# -------- JD Library --------
+class JDLibrary:
+    """SQLite store of custom job descriptions and their precomputed analysis.
+
+    Each description is keyed by a fingerprint of its whitespace-normalized
+    text and stored with its skills, top-30 keywords and term-count vector,
+    plus the skills taxonomy digest the skills were extracted under (they are
+    re-extracted on read after a taxonomy change). profile() builds a
+    roles.RoleProfile from that stored analysis without tokenizing the text
+    again and registers it, so nlp_engine and skill_gap reuse it whenever
+    that exact text is screened against.
+    """
+
+    def __init__(self, path=JD_LIBRARY_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._profiles = {}
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jds (
+                    fingerprint TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    skills TEXT NOT NULL,
+                    keywords TEXT NOT NULL,
+                    vector TEXT NOT NULL,
+                    taxonomy TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jds_title ON jds(title COLLATE NOCASE)")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jds").fetchone()[0]
+
+    def add(self, title, text):
+        """Save a job description (or reuse the stored one with the same text); returns its entry"""
+        text = text.strip()
+        if not text:
+            return None
+        fingerprint = jd_fingerprint(text)
+        entry = self.get(fingerprint)
+        if entry is not None:
+            return entry
+
+        entry = dict(_analyze(text), fingerprint=fingerprint, title=title.strip() or _default_title(text))
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jds (fingerprint, title, text, skills, keywords, vector, taxonomy, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (fingerprint, entry["title"], text, json.dumps(entry["skills"]), json.dumps(entry["keywords"]),
+                 json.dumps(entry["vector"]), entry["taxonomy"], now, now)
+            )
+        return entry
+
+    def add_file(self, title, content):
+        """Save a PDF, DOCX or text job description from raw bytes (None if unsupported or empty)"""
+        text = extract_resume_text(content)
+        if not text:
+            return None
+        return self.add(title, text)
+
+    def get(self, fingerprint):
+        """Stored entry for a fingerprint, or None; re-analyzed if the skills taxonomy changed"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, title, text, skills, keywords, vector, taxonomy FROM jds WHERE fingerprint = ?",
+                (fingerprint,)
+            ).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE jds SET last_used = ? WHERE fingerprint = ?", (time.time(), fingerprint))
+
+        entry = _entry(row)
+        taxonomy = get_taxonomy()
+        if entry["taxonomy"] != taxonomy.digest:
+            # Keywords and the term vector don't depend on the taxonomy; only skills are redone
+            entry["skills"] = taxonomy.extract(entry["text"])
+            entry["taxonomy"] = taxonomy.digest
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE jds SET skills = ?, taxonomy = ? WHERE fingerprint = ?",
+                    (json.dumps(entry["skills"]), entry["taxonomy"], fingerprint)
+                )
+        return entry
+
+    def search(self, query="", limit=20):
+        """Entries whose title contains `query` (case-insensitive), most recently used first"""
+        pattern = "%" + query.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fingerprint, title, text, skills, keywords, vector, taxonomy FROM jds "
+                "WHERE title LIKE ? ESCAPE '\\' ORDER BY last_used DESC LIMIT ?",
+                (pattern, limit)
+            ).fetchall()
+        return [_entry(row) for row in rows]
+
+    def remove(self, fingerprint):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM jds WHERE fingerprint = ?", (fingerprint,))
+        self._profiles.pop(fingerprint, None)
+
+    def profile(self, entry):
+        """RoleProfile of an entry built from its stored analysis, registered for find_role()"""
+        profile = self._profiles.get(entry["fingerprint"])
+        if profile is None or profile.taxonomy_digest != entry["taxonomy"] or profile.name != entry["title"]:
+            profile = RoleProfile(entry["title"], {"description": entry["text"]}, category=CUSTOM_CATEGORY, analysis=entry)
+            self._profiles[entry["fingerprint"]] = profile
+        register_profile(profile)
+        return profile
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def jd_fingerprint(text):
+    """Fingerprint of a job description's whitespace-normalized text"""
+    return text_fingerprint(" ".join(text.split()))
+
+
+def _analyze(text):
+    """Skills, top-30 keywords and term-count vector of a job description"""
+    # Analyzed exactly like a role in the role catalog
+    profile = RoleProfile("", {"description": text}, category=CUSTOM_CATEGORY)
+    return {
+        "text": text,
+        "skills": profile.skills,
+        "keywords": profile.keywords,
+        "vector": dict(profile.tokens.term_counts()),
+        "taxonomy": profile.taxonomy_digest
+    }
+
+
+def _entry(row):
+    fingerprint, title, text, skills, keywords, vector, taxonomy = row
+    return {
+        "fingerprint": fingerprint,
+        "title": title,
+        "text": text,
+        "skills": json.loads(skills),
+        "keywords": json.loads(keywords),
+        "vector": json.loads(vector),
+        "taxonomy": taxonomy
+    }
+
+
+def _default_title(text):
+    """First line of a job description, shortened, for untitled entries"""
+    first_line = text.strip().splitlines()[0].strip()
+    return first_line[:60] + ("..." if len(first_line) > 60 else "")
+
+
+_default_library = None
+_default_library_lock = threading.Lock()
+
+
+def get_jd_library():
+    """Process-wide JDLibrary at JD_LIBRARY_PATH (None if it can't be opened)"""
+    global _default_library
+    with _default_library_lock:
+        if _default_library is None:
+            try:
+                _default_library = JDLibrary()
+            except (sqlite3.Error, OSError) as e:
+                print(f"JD library disabled: {e}")
+                return None
+        return _default_library
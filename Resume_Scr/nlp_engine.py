@@ -1,9 +1,20 @@
 import nltk
 import re
 import string
-from sklearn.feature_extraction.text import TfidfVectorizer
+import math
+import os
+import hashlib
+import heapq
+import threading
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, ENGLISH_STOP_WORDS
 from sklearn.metrics.pairwise import cosine_similarity
-from collections import Counter
+from collections import Counter, OrderedDict
+from functools import cached_property
+
+from roles import ROLES, get_role_catalog, find_role
+from skills import extract_skills
 
 # Download required NLTK data
 try:
@@ -21,11 +32,14 @@ except:
 
 
 # -------- Clean Text --------
+CLEAN_PATTERN = re.compile(r'[^\w\s\+\#\.]')
+
+
 def clean_text(text):
     """Clean and preprocess text"""
     text = text.lower()
     # Keep important technical terms
-    text = re.sub(r'[^\w\s\+\#\.]', ' ', text)  # Keep +, #, . for terms like C++, C#, etc.
+    text = CLEAN_PATTERN.sub(' ', text)  # Keep +, #, . for terms like C++, C#, etc.
     text = ' '.join(text.split())  # Remove extra spaces
     return text
 
@@ -39,71 +53,454 @@ def remove_stopwords(text):
     return " ".join(words)
 
 
+# -------- Tokenizer --------
+# Every document is tokenized once into integer IDs over a shared, append-only
+# vocabulary. Raw whitespace tokens are cleaned like clean_text() (keeping C++,
+# C#, .NET) into "words"; each distinct word's analyzer terms (the \b\w\w+\b
+# tokens TfidfVectorizer sees) are derived once per vocabulary entry and reused
+# by every later document. Once the shared vocabulary holds
+# VOCABULARY_MAX_ENTRIES strings, tokenize() starts a fresh one (a new
+# generation); the old one is freed when no document refers to it any more.
+TOKEN_MEMO_MAX_ENTRIES = int(os.environ.get("RESUME_TOKEN_MEMO_ENTRIES", 200000))
+VOCABULARY_MAX_ENTRIES = int(os.environ.get("RESUME_VOCABULARY_ENTRIES", 200000))
+
+# Same analyzer TfidfVectorizer() uses inside get_match_score
+_analyze = TfidfVectorizer().build_analyzer()
+
+
+class TokenVocabulary:
+    """String <-> integer ID table with per-word derived tokens.
+
+    IDs are never reassigned, so ID arrays stay valid for the life of the
+    vocabulary. Documents from different vocabularies are combined after
+    TokenizedText.in_vocabulary() has moved them into one.
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+        self.is_stop = []
+        self._word_terms = {}
+        self._raw_words = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.strings)
+
+    def _id(self, string):
+        """ID of a string, adding it if new (caller holds the lock)"""
+        i = self.ids.get(string)
+        if i is None:
+            i = len(self.strings)
+            self.ids[string] = i
+            self.strings.append(string)
+            self.is_stop.append(string in ENGLISH_STOP_WORDS)
+        return i
+
+    def _word_id(self, word):
+        """ID of a clean word, deriving its analyzer terms if new (caller holds the lock)"""
+        w = self._id(word)
+        if w not in self._word_terms:
+            self._word_terms[w] = tuple(self._id(t) for t in _analyze(word))
+        return w
+
+    def raw_words(self, raw):
+        """Word IDs of one raw whitespace token, memoized"""
+        words = self._raw_words.get(raw)
+        if words is not None:
+            return words
+        with self._lock:
+            words = tuple(self._word_id(w) for w in CLEAN_PATTERN.sub(' ', raw.lower()).split())
+            if len(self._raw_words) >= TOKEN_MEMO_MAX_ENTRIES:
+                self._raw_words.clear()
+            self._raw_words[raw] = words
+        return words
+
+    def word_ids(self, words):
+        """IDs of already-cleaned words (e.g. another vocabulary's strings)"""
+        with self._lock:
+            return [self._word_id(word) for word in words]
+
+    def word_terms(self, word_id):
+        return self._word_terms[word_id]
+
+
+vocabulary = TokenVocabulary()
+_vocabulary_lock = threading.Lock()
+
+
+def current_vocabulary():
+    """The shared TokenVocabulary, replaced by a fresh one once it reaches VOCABULARY_MAX_ENTRIES"""
+    global vocabulary
+    with _vocabulary_lock:
+        if len(vocabulary) >= VOCABULARY_MAX_ENTRIES:
+            vocabulary = TokenVocabulary()
+        return vocabulary
+
+
+class TokenizedText:
+    """One document as integer token IDs: the single tokenization every scorer reads.
+
+    word_ids   - clean_text() words (what the keyword fallback counts)
+    term_ids   - analyzer terms (TF-IDF and keyword extraction)
+    word_count - raw whitespace-separated word count (length statistics)
+    """
+
+    def __init__(self, text, vocab=None):
+        self.vocab = vocab if vocab is not None else current_vocabulary()
+        word_ids = []
+        word_count = 0
+        for raw in text.split():
+            word_ids.extend(self.vocab.raw_words(raw))
+            word_count += 1
+        self.word_count = word_count
+        self._set_words(word_ids)
+
+    def _set_words(self, word_ids):
+        self.word_ids = np.array(word_ids, dtype=np.int32)
+        term_ids = []
+        for w in word_ids:
+            term_ids.extend(self.vocab.word_terms(w))
+        self.term_ids = np.array(term_ids, dtype=np.int32)
+
+    @classmethod
+    def from_term_counts(cls, term_counts, vocab=None):
+        """A document known only by its {analyzer term: count} vector (e.g. one stored on disk).
+
+        Each term stands in for its own words, so the term-level views
+        (term_ids, unique_terms, terms, term_counts, keyword_counts) equal
+        those of the original text; the word-level ones (clean, word_count,
+        word_frequencies) only see the terms.
+        """
+        doc = cls.__new__(cls)
+        doc.vocab = vocab if vocab is not None else current_vocabulary()
+        terms = sorted(term_counts)
+        ids = np.array(doc.vocab.word_ids(terms), dtype=np.int32)
+        word_ids = np.repeat(ids, [int(term_counts[t]) for t in terms])
+        doc.word_count = len(word_ids)
+        doc._set_words(word_ids.tolist())
+        return doc
+
+    def in_vocabulary(self, vocab):
+        """This document with IDs from `vocab` (itself if they already are)"""
+        if vocab is self.vocab:
+            return self
+        words, inverse = np.unique(self.word_ids, return_inverse=True)
+        mapped = np.array(vocab.word_ids([self.vocab.strings[w] for w in words.tolist()]), dtype=np.int32)
+        moved = TokenizedText.__new__(TokenizedText)
+        moved.vocab = vocab
+        moved.word_count = self.word_count
+        moved._set_words(mapped[inverse].tolist())
+        return moved
+
+    @cached_property
+    def clean(self):
+        """Same string as clean_text(text)"""
+        strings = self.vocab.strings
+        return ' '.join(strings[i] for i in self.word_ids.tolist())
+
+    @cached_property
+    def terms(self):
+        """Analyzer terms in document order"""
+        strings = self.vocab.strings
+        return [strings[i] for i in self.term_ids.tolist()]
+
+    @cached_property
+    def unique_terms(self):
+        """(term IDs, counts) of the distinct analyzer terms"""
+        return np.unique(self.term_ids, return_counts=True)
+
+    def term_counts(self):
+        """{term: count}, as Counter(analyzer tokens) would give"""
+        ids, counts = self.unique_terms
+        strings = self.vocab.strings
+        return Counter({strings[i]: c for i, c in zip(ids.tolist(), counts.tolist())})
+
+    def keyword_counts(self):
+        """Non-stop-word terms in alphabetical order and their counts as float64"""
+        ids, counts = self.unique_terms
+        strings, is_stop = self.vocab.strings, self.vocab.is_stop
+        keep = [(strings[i], c) for i, c in zip(ids.tolist(), counts.tolist()) if not is_stop[i]]
+        keep.sort()
+        terms = np.array([t for t, _ in keep], dtype=object)
+        return terms, np.array([c for _, c in keep], dtype=np.float64)
+
+    def word_frequencies(self):
+        """Clean words by frequency, ties in first-occurrence order (Counter.most_common)"""
+        strings = self.vocab.strings
+        return [strings[w] for w, freq in Counter(self.word_ids.tolist()).most_common()]
+
+
+def tokenize(text, vocab=None):
+    """Tokenize a document once into a TokenizedText (over the shared vocabulary by default)"""
+    return TokenizedText(text, vocab)
+
+
 # -------- Extract Keywords --------
+# Full keyword rankings are memoized per text; any top_n is served from the cached ranking
+KEYWORD_CACHE_MAX_ENTRIES = int(os.environ.get("RESUME_KEYWORD_CACHE_ENTRIES", 1024))
+KEYWORD_CACHE_MAX_BYTES = int(os.environ.get("RESUME_KEYWORD_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+
+class KeywordRanking:
+    """Every keyword of one text, ranked once so any top_n can be read off it.
+
+    TfidfVectorizer(max_features=top_n) keeps the terms at (-counts).argsort()[:top_n]
+    (terms in alphabetical order) and the result is then sorted by score, which for
+    a single document follows the raw counts. Storing the terms, counts and that
+    argsort order reproduces extract_keywords(text, top_n) for every top_n.
+    """
+
+    def __init__(self, text, tokens=None):
+        if tokens is None:
+            tokens = tokenize(text)
+        self.fallback = None
+        self.terms, self.counts = tokens.keyword_counts()
+        if len(self.terms) == 0:
+            # Same fallback as TF-IDF failing: simple word frequency
+            self.fallback = tokens.word_frequencies()
+        else:
+            self.order = (-self.counts).argsort()
+
+    def top(self, top_n):
+        """The top_n keywords, exactly as extract_keywords returns them"""
+        if self.fallback is not None:
+            return self.fallback[:top_n]
+        return list(self.terms[_top_keyword_cols(self.counts, self.order, top_n)])
+
+    def size(self):
+        """Approximate memory held by the ranking, in bytes"""
+        if self.fallback is not None:
+            return sum(len(w) + 56 for w in self.fallback)
+        return sum(len(t) + 56 for t in self.terms) + 16 * len(self.counts)
+
+
+class KeywordCache:
+    """Bounded LRU of KeywordRanking objects keyed by a fingerprint of the text"""
+
+    def __init__(self, max_entries=KEYWORD_CACHE_MAX_ENTRIES, max_bytes=KEYWORD_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ranking(self, text, tokens=None):
+        """Cached KeywordRanking for a text, computing it on a miss (from `tokens` if given)"""
+        key = text_fingerprint(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        
+        ranking = KeywordRanking(text, tokens)
+        size = ranking.size()
+        with self._lock:
+            if key not in self._entries and size <= self.max_bytes:
+                self._entries[key] = (ranking, size)
+                self.bytes += size
+                self._evict()
+        return ranking
+
+    def _evict(self):
+        """Drop least recently used rankings until both caps are met"""
+        while self._entries and (len(self._entries) > self.max_entries or self.bytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """Entry count, approximate bytes and hit/miss counters"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+def text_fingerprint(text):
+    """Content hash used as the keyword cache key"""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+keyword_cache = KeywordCache()
+
+
 def extract_keywords(text, top_n=20):
     """Extract top keywords from text using TF-IDF"""
-    # Clean text
-    clean = clean_text(text)
-    
-    # Use TF-IDF
-    try:
-        vectorizer = TfidfVectorizer(max_features=top_n, stop_words='english')
-        tfidf_matrix = vectorizer.fit_transform([clean])
-        feature_names = vectorizer.get_feature_names_out()
+    return keyword_cache.ranking(text).top(top_n)
+
+
+def keyword_cache_stats():
+    """Hit/miss counters and size of the process-wide keyword cache"""
+    return keyword_cache.stats()
+
+
+# -------- Job Descriptions --------
+def job_tokens(job_description):
+    """(TokenizedText, KeywordRanking) of a JD; precomputed for roles.ROLES descriptions"""
+    role = find_role(job_description)
+    if role is not None:
+        vocab = current_vocabulary()
+        if role.tokens.vocab is not vocab:
+            # Follow the shared vocabulary to its new generation so the old one can be freed
+            role.tokens = role.tokens.in_vocabulary(vocab)
+        return role.tokens, role.ranking
+    tokens = tokenize(job_description)
+    return tokens, keyword_cache.ranking(job_description, tokens)
+
+
+def job_skills(job_description):
+    """extract_skills of a JD; precomputed for roles.ROLES descriptions"""
+    role = find_role(job_description)
+    if role is not None:
+        return list(role.skills)
+    return extract_skills(job_description)
+
+
+# -------- Analysis Context --------
+class AnalysisContext:
+    """Intermediates for one resume/JD pair, each computed on first use and then reused.
+
+    Pass it as `context=` to get_match_score, get_detailed_match_score,
+    generate_suggestions, calculate_resume_strength, role_fit_scores and
+    skills.skill_gap so a whole analysis page runs off one set of computations.
+    """
+
+    def __init__(self, resume_text, job_description, resume_skills=None):
+        self.resume_text = resume_text
+        self.job_description = job_description
+        if resume_skills is not None:
+            # Skills the caller already extracted
+            self.resume_skills = resume_skills
+
+    # One tokenization per document; everything below reads from it
+    @cached_property
+    def resume_tokenized(self):
+        return tokenize(self.resume_text)
+
+    @cached_property
+    def jd_tokenized(self):
+        return job_tokens(self.job_description)[0]
+
+    # Cleaned text and analyzer tokens (what TfidfVectorizer() sees)
+    @cached_property
+    def resume_clean(self):
+        return self.resume_tokenized.clean
+
+    @cached_property
+    def jd_clean(self):
+        return self.jd_tokenized.clean
+
+    @cached_property
+    def resume_tokens(self):
+        return self.resume_tokenized.terms
+
+    @cached_property
+    def jd_tokens(self):
+        return self.jd_tokenized.terms
+
+    @cached_property
+    def resume_counts(self):
+        return self.resume_tokenized.term_counts()
+
+    @cached_property
+    def word_count(self):
+        return self.resume_tokenized.word_count
+
+    # Keyword rankings (shared with the process-wide keyword cache)
+    @cached_property
+    def resume_ranking(self):
+        return keyword_cache.ranking(self.resume_text, self.resume_tokenized)
+
+    @cached_property
+    def jd_ranking(self):
+        return job_tokens(self.job_description)[1]
+
+    def resume_keywords(self, top_n=20):
+        return self.resume_ranking.top(top_n)
+
+    def jd_keywords(self, top_n=20):
+        return self.jd_ranking.top(top_n)
+
+    # Skills (a role's JD skills come precomputed from the role catalog)
+    @cached_property
+    def resume_skills(self):
+        return extract_skills(self.resume_text)
+
+    @cached_property
+    def job_skills(self):
+        return job_skills(self.job_description)
+
+    # TF-IDF vectors of the pair, fitted on the two token lists
+    @cached_property
+    def vectors(self):
+        try:
+            vectorizer = TfidfVectorizer(analyzer=list, token_pattern=None)
+            return vectorizer.fit_transform([self.resume_tokens, self.jd_tokens])
+        except:
+            return None
+
+    @cached_property
+    def cosine_score(self):
+        if self.vectors is None:
+            return 0
+        return cosine_similarity(self.vectors[0], self.vectors[1])[0][0]
+
+    @cached_property
+    def match_score(self):
+        """get_match_score for the pair"""
+        # Method 1: TF-IDF Cosine Similarity (70% weight)
+        cosine_score = self.cosine_score
+        
+        # Method 2: Keyword Overlap (30% weight)
+        resume_keywords = set(self.resume_keywords(30))
+        jd_keywords = set(self.jd_keywords(30))
         
-        # Get scores
-        scores = tfidf_matrix.toarray()[0]
-        keywords = [(feature_names[i], scores[i]) for i in range(len(feature_names))]
-        keywords = sorted(keywords, key=lambda x: x[1], reverse=True)
+        if len(jd_keywords) > 0:
+            keyword_overlap = len(resume_keywords & jd_keywords) / len(jd_keywords)
+        else:
+            keyword_overlap = 0
         
-        return [kw[0] for kw in keywords]
-    except:
-        # Fallback to simple word frequency
-        words = clean.split()
-        word_freq = Counter(words)
-        return [word for word, freq in word_freq.most_common(top_n)]
+        # Combined score
+        final_score = (cosine_score * 0.7) + (keyword_overlap * 0.3)
+        
+        return round(final_score * 100, 2)
 
 
 # -------- Advanced Matching Score --------
-def get_match_score(resume_text, job_description):
+def get_match_score(resume_text, job_description, context=None):
     """Calculate matching score between resume and job description"""
-    
-    resume_clean = clean_text(resume_text)
-    jd_clean = clean_text(job_description)
-    
-    # Method 1: TF-IDF Cosine Similarity (70% weight)
-    try:
-        vectorizer = TfidfVectorizer()
-        vectors = vectorizer.fit_transform([resume_clean, jd_clean])
-        cosine_score = cosine_similarity(vectors[0], vectors[1])[0][0]
-    except:
-        cosine_score = 0
-    
-    # Method 2: Keyword Overlap (30% weight)
-    resume_keywords = set(extract_keywords(resume_text, 30))
-    jd_keywords = set(extract_keywords(job_description, 30))
-    
-    if len(jd_keywords) > 0:
-        keyword_overlap = len(resume_keywords & jd_keywords) / len(jd_keywords)
-    else:
-        keyword_overlap = 0
-    
-    # Combined score
-    final_score = (cosine_score * 0.7) + (keyword_overlap * 0.3)
-    
-    return round(final_score * 100, 2)
+    if context is None:
+        context = AnalysisContext(resume_text, job_description)
+    return context.match_score
 
 
 # -------- Enhanced Match Score with Details --------
-def get_detailed_match_score(resume_text, job_description, resume_skills=None):
+def get_detailed_match_score(resume_text, job_description, resume_skills=None, context=None):
     """Get detailed matching score with breakdown"""
+    if context is None:
+        context = AnalysisContext(resume_text, job_description)
     
     # Basic match score
-    base_score = get_match_score(resume_text, job_description)
+    base_score = context.match_score
     
     # Keyword matching
-    resume_keywords = set(extract_keywords(resume_text, 25))
-    jd_keywords = set(extract_keywords(job_description, 25))
+    resume_keywords = set(context.resume_keywords(25))
+    jd_keywords = set(context.jd_keywords(25))
     matched_keywords = resume_keywords & jd_keywords
     missing_keywords = jd_keywords - resume_keywords
     
@@ -125,39 +522,887 @@ def get_detailed_match_score(resume_text, job_description, resume_skills=None):
     }
 
 
-# -------- Rank Multiple Resumes --------
-def rank_resumes(resume_list, job_description):
-    """Rank multiple resumes against job description"""
-    results = []
+# -------- Precompiled Job Index --------
+# get_match_score fits TF-IDF on just (resume, JD). With smoothed IDF over two
+# documents a term shared by both gets idf 1 and a term in only one gets
+# PAIR_IDF, so the pairwise cosine can be computed from raw term counts:
+#   dot   = sum over shared terms of r_t * j_t
+#   |r|^2 = PAIR_IDF^2 * sum r_t^2 - (PAIR_IDF^2 - 1) * sum over shared terms of r_t^2
+# (same for |j|). _cross_cosine (Cross Matching section) evaluates it as sparse products.
+PAIR_IDF = 1 + math.log(3 / 2)
+PAIR_IDF_SQ = PAIR_IDF ** 2
+
+def term_counts(text):
+    """Raw term counts of a text, tokenized exactly like get_match_score"""
+    return tokenize(text).term_counts()
+
+
+class JobIndex:
+    """Job descriptions compiled once for fast scoring of resumes against all of them.
+
+    Holds the JD term-count matrices over a fitted vocabulary and each JD's
+    top-30 keyword set. match_scores() returns, for one resume, the same
+    values get_match_score(resume_text, jd) gives for every JD, with one
+    tokenization and keyword extraction of the resume and sparse
+    matrix-vector products instead of per-JD vectorizer fits. JDs whose
+    term counts and top-30 keywords are already known (e.g. role catalog
+    profiles) can pass them as `jd_counts` and `jd_keywords`.
+    """
+
+    def __init__(self, job_descriptions, jd_counts=None, jd_keywords=None):
+        self.job_descriptions = list(job_descriptions)
+        if jd_counts is None:
+            jd_counts = [term_counts(jd) for jd in self.job_descriptions]
+        
+        self.vocabulary = {}
+        for counts in jd_counts:
+            for term in counts:
+                self.vocabulary.setdefault(term, len(self.vocabulary))
+        
+        self.counts = _keyed_matrix(jd_counts, self.vocabulary)
+        
+        # Keyword overlap component: top-30 keywords per JD as a binary matrix
+        if jd_keywords is None:
+            jd_keywords = [extract_keywords(jd, 30) for jd in self.job_descriptions]
+        self.keywords = [set(keywords) for keywords in jd_keywords]
+        self.keyword_vocabulary = {}
+        for keywords in self.keywords:
+            for kw in keywords:
+                self.keyword_vocabulary.setdefault(kw, len(self.keyword_vocabulary))
+        self.keyword_matrix = _keyed_matrix(
+            [dict.fromkeys(keywords, 1) for keywords in self.keywords], self.keyword_vocabulary
+        )
+        self.keyword_sizes = np.array([len(k) for k in self.keywords], dtype=np.float64)
+
+    def __len__(self):
+        return len(self.job_descriptions)
+
+    def cosine_scores(self, counts):
+        """Pairwise-TF-IDF cosine of one resume (term counts) against every JD"""
+        # Terms no JD uses only add to the resume's norm, so the row keeps just the JD columns
+        r_total_sq = np.array([float(sum(c * c for c in counts.values()))])
+        return _cross_cosine(_keyed_matrix([counts], self.vocabulary), self.counts, r_total_sq)[0]
+
+    def keyword_overlaps(self, keywords):
+        """Share of each JD's top-30 keywords found in the resume's top-30 keywords"""
+        k = np.zeros(len(self.keyword_vocabulary))
+        for kw in keywords:
+            col = self.keyword_vocabulary.get(kw)
+            if col is not None:
+                k[col] = 1
+        hits = self.keyword_matrix @ k
+        return np.divide(hits, self.keyword_sizes, out=np.zeros_like(hits), where=self.keyword_sizes > 0)
+
+    def match_scores(self, resume_text, context=None):
+        """get_match_score(resume_text, jd) for every JD, as an array"""
+        if context is not None:
+            cosine = self.cosine_scores(context.resume_counts)
+            overlap = self.keyword_overlaps(set(context.resume_keywords(30)))
+        else:
+            cosine = self.cosine_scores(term_counts(resume_text))
+            overlap = self.keyword_overlaps(set(extract_keywords(resume_text, 30)))
+        return np.round((cosine * 0.7 + overlap * 0.3) * 100, 2)
+
+
+_role_index = None
+
+
+def get_role_index():
+    """JobIndex over roles.ROLES, rebuilt only when the role catalog changes"""
+    global _role_index
+    catalog = get_role_catalog()
+    if _role_index is None or _role_index.fingerprint != catalog.fingerprint:
+        profiles = list(catalog)
+        # Term counts and keywords come from the profiles, so no role is tokenized again
+        index = JobIndex(
+            [p.description for p in profiles],
+            jd_counts=[p.tokens.term_counts() for p in profiles],
+            jd_keywords=[p.keywords for p in profiles]
+        )
+        index.role_names = [p.name for p in profiles]
+        index.role_categories = [p.category for p in profiles]
+        index.fingerprint = catalog.fingerprint
+        _role_index = index
+    return _role_index
+
+
+def role_fit_scores(resume_text, context=None):
+    """Match % of a resume against every role: the User Mode "all roles" table rows"""
+    index = get_role_index()
+    scores = index.match_scores(resume_text, context)
+    return [
+        {
+            "Job Role": role,
+            "Match %": float(score),
+            "Category": category
+        }
+        for role, category, score in zip(index.role_names, index.role_categories, scores)
+    ]
+
+
+# -------- Sparse Count Matrices --------
+def _keyed_matrix(rows, columns):
+    """CSR matrix of {key: value} dict rows over a fixed {key: column} map (other keys dropped)"""
+    indptr, indices, data = [0], [], []
+    for row in rows:
+        for key, value in row.items():
+            col = columns.get(key)
+            if col is not None:
+                indices.append(col)
+                data.append(value)
+        indptr.append(len(indices))
+    return sparse.csr_matrix(
+        (np.array(data, dtype=np.float64), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+        shape=(len(rows), len(columns))
+    )
+
+
+def _id_rows_matrix(rows, width, dtype=np.float64):
+    """CSR matrix of (column IDs, values) array rows, e.g. TokenVocabulary term IDs and counts"""
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(ids) for ids, _ in rows])
+    if rows and indptr[-1]:
+        indices = np.concatenate([ids for ids, _ in rows]).astype(np.int64)
+        data = np.concatenate([values for _, values in rows]).astype(dtype)
+    else:
+        indices = np.zeros(0, dtype=np.int64)
+        data = np.zeros(0, dtype=dtype)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), width))
+
+
+def _term_count_matrix(docs):
+    """(float32 CSR term counts, terms) of tokenized documents (one vocabulary).
+
+    Columns are only the terms the documents use, in alphabetical order.
+    """
+    unique = [doc.unique_terms for doc in docs]
+    all_ids = np.unique(np.concatenate([ids for ids, _ in unique]))
+    strings = docs[0].vocab.strings
+    order = sorted(range(len(all_ids)), key=lambda k: strings[all_ids[k]])
+    rank = np.empty(len(all_ids), dtype=np.int64)
+    rank[order] = np.arange(len(all_ids))
+    terms = np.array([strings[all_ids[k]] for k in order], dtype=object)
     
-    for resume in resume_list:
-        # Calculate detailed score
-        score_details = get_detailed_match_score(
-            resume["text"], 
-            job_description,
-            resume.get("skills", [])
+    matrix = _id_rows_matrix(
+        [(rank[np.searchsorted(all_ids, ids)], counts) for ids, counts in unique], len(all_ids), np.float32
+    )
+    matrix.sort_indices()
+    return matrix, terms
+
+
+# -------- Batch Ranking --------
+class BatchMatch:
+    """One JD scored against many resumes in a single pass.
+
+    All resumes and the JD are tokenized once into a float32 term-count matrix
+    over their shared vocabulary. Cosine similarities use the pairwise TF-IDF
+    identity from the Job Index section as sparse matrix-vector products, and
+    each resume's top-30 keywords are read off its matrix row with the same
+    tie-breaking as extract_keywords, so scores equal the per-resume path. The
+    JD's keywords are extracted once.
+
+    Only what the score needs is computed up front (`scores`); details(i)
+    derives the keyword explanation for one resume on demand, and explainer(i)
+    defers it without keeping the batch alive.
+    """
+
+    def __init__(self, resume_texts, job_description, resume_skills=None):
+        self.resume_texts = list(resume_texts)
+        self.job_description = job_description
+        self.resume_skills = resume_skills if resume_skills is not None else [None] * len(self.resume_texts)
+        self._fallback = None
+        if not self.resume_texts:
+            self.scores = []
+            return
+        
+        jd_tokens, jd_ranking = job_tokens(job_description)
+        docs = [jd_tokens] + [tokenize(t, jd_tokens.vocab) for t in self.resume_texts]
+        matrix, terms = _term_count_matrix(docs)
+        if len(terms) == 0:
+            # Nothing tokenizable anywhere: fall back to the per-resume path
+            self._fallback = [
+                get_detailed_match_score(text, job_description, skills)
+                for text, skills in zip(self.resume_texts, self.resume_skills)
+            ]
+            self.scores = [d["score"] for d in self._fallback]
+            return
+        resumes = matrix[1:]
+        
+        self.cosine = _cross_cosine(resumes, matrix[:1])[:, 0]
+        
+        # Keyword sets: extract_keywords ranks non-stop-word terms by count
+        keyword_cols = np.array([t not in ENGLISH_STOP_WORDS for t in terms])
+        self._keyword_counts = resumes[:, np.flatnonzero(keyword_cols)].tocsr()
+        self._keyword_counts.sort_indices()
+        self._keyword_terms = terms[keyword_cols]
+        self._docs = docs[1:]
+        
+        jd_keywords_30 = set(jd_ranking.top(30))
+        self.jd_keywords_25 = set(jd_ranking.top(25))
+        fallback_30, top_30 = _batch_keywords(self._keyword_counts, self.resume_texts, self._docs)
+        
+        # Keyword overlap of the top-30 sets as one sparse product
+        jd_vector = np.isin(self._keyword_terms, list(jd_keywords_30)).astype(np.float32)
+        hits = np.asarray(top_30 @ jd_vector).ravel()
+        for i, keywords in fallback_30.items():
+            # Rows that fell back to plain word frequency may hold non-vocabulary words
+            hits[i] = len(keywords & jd_keywords_30)
+        self.overlap = hits / len(jd_keywords_30) if jd_keywords_30 else np.zeros(len(self.resume_texts))
+        
+        self.base_scores = [
+            round((float(c) * 0.7 + float(o) * 0.3) * 100, 2)
+            for c, o in zip(self.cosine.tolist(), self.overlap.tolist())
+        ]
+        self.scores = [
+            _final_score(base, skills) for base, skills in zip(self.base_scores, self.resume_skills)
+        ]
+
+    def __len__(self):
+        return len(self.resume_texts)
+
+    def _row_keywords(self, i):
+        """(keyword terms, counts) of resume i's matrix row"""
+        counts_row = self._keyword_counts
+        start, end = counts_row.indptr[i], counts_row.indptr[i + 1]
+        return self._keyword_terms[counts_row.indices[start:end]], counts_row.data[start:end]
+
+    def resume_keywords_25(self, i):
+        """Top-25 keyword set of resume i"""
+        terms, counts = self._row_keywords(i)
+        return _row_keywords_25(terms, counts, self.resume_texts[i], self._docs[i])
+
+    def details(self, i):
+        """get_detailed_match_score(...) for resume i"""
+        if self._fallback is not None:
+            return self._fallback[i]
+        return _match_details(
+            self.cosine[i], self.overlap[i], self.resume_keywords_25(i), self.jd_keywords_25, self.resume_skills[i]
         )
+
+    def explainer(self, i):
+        """details(i) as a callable that holds only resume i's row, not the whole batch"""
+        if self._fallback is not None:
+            details = self._fallback[i]
+            return lambda: details
+        terms, counts = self._row_keywords(i)
+        text = self.resume_texts[i] if len(terms) == 0 else None
+        cosine, overlap = float(self.cosine[i]), float(self.overlap[i])
+        jd_keywords, skills = self.jd_keywords_25, self.resume_skills[i]
+        return lambda: _match_details(cosine, overlap, _row_keywords_25(terms, counts, text), jd_keywords, skills)
+
+
+def _row_keywords_25(terms, counts, text, doc=None):
+    """Top-25 keyword set of one count-matrix row (word-frequency fallback on `text` if it has none)"""
+    if len(terms) == 0:
+        return set(keyword_cache.ranking(text, doc).top(25))
+    counts = counts.astype(np.float64)
+    return set(terms[_top_keyword_cols(counts, (-counts).argsort(), 25)])
+
+
+def batch_match_details(resume_texts, job_description, resume_skills=None):
+    """get_detailed_match_score for many resumes against one JD in a single pass (see BatchMatch)"""
+    match = BatchMatch(resume_texts, job_description, resume_skills)
+    return [match.details(i) for i in range(len(match))]
+
+
+def _final_score(base_score, skills):
+    """Base match score plus the skills bonus, capped at 100"""
+    skills_bonus = 0
+    if skills:
+        skills_bonus = min(len(skills) * 0.5, 10)
+    return round(min(base_score + skills_bonus, 100), 2)
+
+
+def _match_details(cosine, overlap, resume_keywords, jd_keywords, skills):
+    """get_detailed_match_score's dict from the pair's cosine, top-30 overlap and top-25 keyword sets"""
+    base_score = round((float(cosine) * 0.7 + float(overlap) * 0.3) * 100, 2)
+    matched_keywords = resume_keywords & jd_keywords
+    missing_keywords = jd_keywords - resume_keywords
+    
+    skills_bonus = 0
+    if skills:
+        skills_bonus = min(len(skills) * 0.5, 10)
+    
+    return {
+        "score": _final_score(base_score, skills),
+        "base_score": base_score,
+        "skills_bonus": skills_bonus,
+        "matched_keywords": list(matched_keywords)[:10],
+        "missing_keywords": list(missing_keywords)[:10],
+        "resume_keywords": list(resume_keywords)[:15],
+        "jd_keywords": list(jd_keywords)[:15]
+    }
+
+
+def _batch_keywords(keyword_counts, resume_texts, docs):
+    """Top-30 keywords of every resume row as a binary matrix over the keyword columns.
+
+    Mirrors extract_keywords: terms are in alphabetical order, TfidfVectorizer's
+    max_features keeps (-counts).argsort()[:top_n], and the survivors are
+    ordered by count (ties alphabetical) before becoming a set. Rows without
+    any keyword term use extract_keywords' word-frequency fallback; their
+    top-30 sets are returned separately as {row: set}.
+    """
+    fallback = {}
+    indptr, indices = [0], []
+    for i in range(keyword_counts.shape[0]):
+        start, end = keyword_counts.indptr[i], keyword_counts.indptr[i + 1]
+        cols = keyword_counts.indices[start:end]
+        if len(cols) == 0:
+            fallback[i] = set(keyword_cache.ranking(resume_texts[i], docs[i]).top(30))
+        else:
+            counts = keyword_counts.data[start:end].astype(np.float64)
+            indices.extend(cols[_top_keyword_cols(counts, (-counts).argsort(), 30)])
+        indptr.append(len(indices))
+    
+    top_30 = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.float32), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+        shape=keyword_counts.shape
+    )
+    return fallback, top_30
+
+
+def _top_keyword_cols(counts, order, top_n):
+    """Positions of a row's top_n keywords, in extract_keywords' output order"""
+    if top_n is not None and len(counts) > top_n:
+        keep = np.sort(order[:top_n])
+    else:
+        keep = np.arange(len(counts))
+    return keep[np.argsort(-counts[keep], kind="stable")]
+
+
+# -------- Rank Multiple Resumes --------
+# Fields of a ranking entry that explain the score; top-k rankings compute them on first access
+EXPLANATION_FIELDS = ("matched_keywords", "missing_keywords", "matched_skills", "missing_skills")
+
+
+class RankedCandidate(dict):
+    """Ranking entry whose explanation fields are filled in when first read.
+
+    candidate["matched_keywords"] and candidate.get("missing_skills") run the
+    `explain` callable once and merge its fields in. So does anything that
+    walks the whole dict (iteration, keys/items/values, len, copy, dict(...),
+    pd.DataFrame(...)), so exports always hold every field; reading the
+    eager fields by key does not.
+    """
+
+    def __init__(self, fields=(), explain=None):
+        super().__init__(fields)
+        self._explain = explain
+
+    def __missing__(self, key):
+        if key in EXPLANATION_FIELDS and self._explain is not None:
+            return self.materialize()[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return super().__contains__(key) or (key in EXPLANATION_FIELDS and self._explain is not None)
+
+    def get(self, key, default=None):
+        if key in EXPLANATION_FIELDS and self._explain is not None and not super().__contains__(key):
+            self.materialize()
+        return super().get(key, default)
+
+    def materialize(self):
+        """Compute the pending explanation fields now"""
+        if self._explain is not None:
+            explain, self._explain = self._explain, None
+            self.update(explain())
+        return self
+
+    def __iter__(self):
+        return super(RankedCandidate, self.materialize()).__iter__()
+
+    def __len__(self):
+        return super(RankedCandidate, self.materialize()).__len__()
+
+    def __eq__(self, other):
+        return super(RankedCandidate, self.materialize()).__eq__(other)
+
+    def __repr__(self):
+        return super(RankedCandidate, self.materialize()).__repr__()
+
+    def keys(self):
+        return super(RankedCandidate, self.materialize()).keys()
+
+    def items(self):
+        return super(RankedCandidate, self.materialize()).items()
+
+    def values(self):
+        return super(RankedCandidate, self.materialize()).values()
+
+    def copy(self):
+        return dict(self.items())
+
+    def set_explanation(self, explain):
+        """Drop computed explanation fields and defer to a new `explain` (e.g. after a JD change)"""
+        for field in EXPLANATION_FIELDS:
+            self.pop(field, None)
+        self._explain = explain
+
+
+def _candidate_fields(resume, score):
+    """Ranking entry fields that every ranking fills in eagerly: contact details and score"""
+    return {
+        "name": resume.get("name", "Unknown"),
+        "email": resume.get("email", "N/A"),
+        "phone": resume.get("phone", "N/A"),
+        "experience_years": resume.get("experience_years", "N/A"),
+        "education": resume.get("education", "N/A"),
+        "score": score
+    }
+
+
+def _ranking_entry(resume, score_details):
+    """Ranked-list entry for one resume and its detailed match score"""
+    entry = _candidate_fields(resume, score_details["score"])
+    entry["matched_keywords"] = score_details["matched_keywords"]
+    entry["missing_keywords"] = score_details["missing_keywords"]
+    return entry
+
+
+def _skill_gap_fields(resume_skills, job_skills):
+    """matched_skills / missing_skills explanation fields (job skill order)"""
+    resume_skills = set(resume_skills or [])
+    return {
+        "matched_skills": [s for s in job_skills if s in resume_skills],
+        "missing_skills": [s for s in job_skills if s not in resume_skills]
+    }
+
+
+def _top_k_indices(scores, orders, k=None):
+    """Indices of the k best scores, best first, ties by ascending order (all if k is None).
+
+    Same result as sorting everything by (-score, order) and slicing, but with
+    argpartition the cost is linear in the number of candidates plus k log k.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    orders = np.asarray(orders)
+    n = len(scores)
+    if k is not None and k < n:
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64)
+        threshold = scores[np.argpartition(-scores, k - 1)[:k]].min()
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)
+        ties = ties[np.argsort(orders[ties], kind="stable")][:k - len(above)]
+        idx = np.concatenate([above, ties])
+    else:
+        idx = np.arange(n)
+    return idx[np.lexsort((orders[idx], -scores[idx]))]
+
+
+def rank_resumes(resume_list, job_description, top_k=None):
+    """Rank multiple resumes against job description
+
+    Every entry has the same fields, including the matched_skills and
+    missing_skills skill gap against the JD. With `top_k`, only the best
+    top_k entries are returned, selected by argpartition over one score per
+    resume; their keyword and skill-gap explanation fields are RankedCandidate
+    fields computed on first access.
+    """
+    resume_list = list(resume_list)
+    match = BatchMatch(
+        [resume["text"] for resume in resume_list],
+        job_description,
+        [resume.get("skills", []) for resume in resume_list]
+    )
+    
+    if top_k is None:
+        required_skills = job_skills(job_description)
+        results = []
+        for i, resume in enumerate(resume_list):
+            entry = _ranking_entry(resume, match.details(i))
+            entry.update(_skill_gap_fields(resume.get("skills"), required_skills))
+            results.append(entry)
         
-        results.append({
-            "name": resume.get("name", "Unknown"),
-            "email": resume.get("email", "N/A"),
-            "phone": resume.get("phone", "N/A"),
-            "experience_years": resume.get("experience_years", "N/A"),
-            "education": resume.get("education", "N/A"),
-            "score": score_details["score"],
-            "matched_keywords": score_details["matched_keywords"],
-            "missing_keywords": score_details["missing_keywords"]
-        })
+        # Sort by score (descending)
+        results = sorted(results, key=lambda x: x["score"], reverse=True)
+        
+        return results
     
-    # Sort by score (descending)
-    results = sorted(results, key=lambda x: x["score"], reverse=True)
+    required_skills = []
     
+    def explain(details, skills):
+        details = details()
+        if not required_skills:
+            required_skills.append(job_skills(job_description))
+        fields = {
+            "matched_keywords": details["matched_keywords"],
+            "missing_keywords": details["missing_keywords"]
+        }
+        fields.update(_skill_gap_fields(skills, required_skills[0]))
+        return fields
+    
+    results = []
+    for i in _top_k_indices(match.scores, np.arange(len(resume_list)), top_k).tolist():
+        resume = resume_list[i]
+        # Each entry holds only its own row's data, so the batch is freed once ranking returns
+        details, skills = match.explainer(i), resume.get("skills")
+        results.append(RankedCandidate(
+            _candidate_fields(resume, match.scores[i]),
+            lambda details=details, skills=skills: explain(details, skills)
+        ))
     return results
 
 
+# -------- Incremental Screening Session --------
+class ScreeningSession:
+    """An ongoing screening: candidates kept as feature vectors so each upload only costs its own work.
+
+    Each candidate is stored as its analyzer-term IDs and counts over the
+    session's own append-only TokenVocabulary (IDs never change, so stored
+    vectors stay valid as new documents grow it, and the strings are freed with
+    the session) plus its top-30/top-25 keyword sets.
+    add() tokenizes and scores only the new resume; set_job_description()
+    re-scores every stored vector without touching the resume texts. Records
+    are RankedCandidate dicts: keyword and skill-gap explanations are only
+    computed for candidates whose details are actually read.
+
+    Tolerance: a candidate's score only depends on its own (resume, JD) pair,
+    so ranked() matches rank_resumes() over all candidates. Cosines agree with a
+    full recompute to within 1e-12 (floating-point summation order only); a
+    rounded score can therefore differ by 0.01 only when it lies exactly on a
+    rounding boundary.
+    """
+
+    def __init__(self, job_description):
+        self.vocab = TokenVocabulary()
+        self._features = []
+        self._records = []
+        self.set_job_description(job_description)
+
+    def __len__(self):
+        return len(self._records)
+
+    def set_job_description(self, job_description):
+        """Switch the JD and re-rank every stored candidate from its vector"""
+        self.job_description = job_description
+        tokens, ranking = job_tokens(job_description)
+        self._jd_terms = tokens.in_vocabulary(self.vocab).unique_terms
+        self._jd_keywords_30 = set(ranking.top(30))
+        self._jd_keywords_25 = set(ranking.top(25))
+        self._job_skills = None
+        for features, record, score in zip(self._features, self._records, self._scores(self._features)):
+            record["score"] = score
+            record.set_explanation(lambda features=features: self._explanation(features))
+
+    @property
+    def job_skills(self):
+        if self._job_skills is None:
+            self._job_skills = job_skills(self.job_description)
+        return self._job_skills
+
+    def add(self, resume, record=None, order=None):
+        """Score one parsed resume and keep its vector; returns its ranking record.
+
+        The ranking entry fields are added to `record`'s fields (default: none)
+        in a new RankedCandidate. `order` breaks score ties in ranked()
+        (default: insertion order).
+        """
+        tokens = tokenize(resume["text"], self.vocab)
+        ids, counts = tokens.unique_terms
+        ranking = keyword_cache.ranking(resume["text"], tokens)
+        features = {
+            "ids": ids,
+            "counts": counts.astype(np.float32),
+            "keywords_30": set(ranking.top(30)),
+            "keywords_25": set(ranking.top(25)),
+            "skills": resume.get("skills", []),
+            "order": len(self._records) if order is None else order
+        }
+        record = RankedCandidate(record or {}, lambda: self._explanation(features))
+        record.update(_candidate_fields(resume, self._scores([features])[0]))
+        self._features.append(features)
+        self._records.append(record)
+        return record
+
+    def _ranked_indices(self, top_k=None):
+        scores = [record["score"] for record in self._records]
+        orders = [features["order"] for features in self._features]
+        return _top_k_indices(scores, orders, top_k).tolist()
+
+    def ranked(self, top_k=None):
+        """Records by score, best first (ties in `order`); only the best top_k if given"""
+        return [self._records[i] for i in self._ranked_indices(top_k)]
+
+    def cross_match(self, job_descriptions=None, chunk_size=None):
+        """CrossMatch of the stored candidates, rows in ranked() order, against many JDs.
+
+        Uses the stored vectors and top-30 keyword sets, so no resume is re-read.
+        `job_descriptions` is as for cross_match().
+        """
+        chunk_size = chunk_size or CROSS_MATCH_CHUNK_SIZE
+        labels, jds = _job_set(job_descriptions)
+        jd_tokens, jd_rankings = zip(*[job_tokens(jd) for jd in jds]) if jds else ((), ())
+        jd_keywords = [set(ranking.top(30)) for ranking in jd_rankings]
+        jd_terms = [tokens.in_vocabulary(self.vocab).unique_terms for tokens in jd_tokens]
+        width = len(self.vocab)
+        jd_rows = _id_rows_matrix(jd_terms, width)
+        
+        features = [self._features[i] for i in self._ranked_indices()]
+        cosine = np.zeros((len(features), len(jds)))
+        overlap = np.zeros((len(features), len(jds)))
+        for start in range(0, len(features), chunk_size):
+            chunk = features[start:start + chunk_size]
+            rows = _id_rows_matrix([(f["ids"], f["counts"]) for f in chunk], width)
+            keyword_vocabulary = {}
+            for keywords in [f["keywords_30"] for f in chunk] + jd_keywords:
+                for kw in keywords:
+                    keyword_vocabulary.setdefault(kw, len(keyword_vocabulary))
+            resume_keywords = _keyed_matrix([dict.fromkeys(f["keywords_30"], 1) for f in chunk], keyword_vocabulary)
+            jd_keyword_rows = _keyed_matrix([dict.fromkeys(k, 1) for k in jd_keywords], keyword_vocabulary)
+            end = start + len(chunk)
+            cosine[start:end] = _cross_cosine(rows, jd_rows)
+            overlap[start:end] = _cross_overlap(resume_keywords @ jd_keyword_rows.T, jd_keywords)
+        return CrossMatch(cosine, overlap, labels)
+
+    def _scores(self, features):
+        """Match scores of stored candidates against the current JD"""
+        if len(self._jd_terms[0]):
+            width = len(self.vocab)
+            rows = _id_rows_matrix([(f["ids"], f["counts"]) for f in features], width)
+            cosine = _cross_cosine(rows, _id_rows_matrix([self._jd_terms], width))[:, 0]
+        else:
+            # A JD with no terms (e.g. "" or only punctuation) matches nothing
+            cosine = np.zeros(len(features))
+        
+        jd_keywords = self._jd_keywords_30
+        scores = []
+        for f, c in zip(features, cosine.tolist()):
+            overlap = len(f["keywords_30"] & jd_keywords) / len(jd_keywords) if jd_keywords else 0
+            base_score = round((c * 0.7 + overlap * 0.3) * 100, 2)
+            scores.append(_final_score(base_score, f["skills"]))
+        return scores
+
+    def _explanation(self, features):
+        resume_keywords = features["keywords_25"]
+        fields = {
+            "matched_keywords": list(resume_keywords & self._jd_keywords_25)[:10],
+            "missing_keywords": list(self._jd_keywords_25 - resume_keywords)[:10]
+        }
+        fields.update(_skill_gap_fields(features["skills"], self.job_skills))
+        return fields
+
+
+# -------- Cross Matching --------
+# Resumes scored per chunk, so intermediate matrices stay (chunk x JDs) in size
+CROSS_MATCH_CHUNK_SIZE = int(os.environ.get("RESUME_CROSS_MATCH_CHUNK_SIZE", 500))
+
+
+class CrossMatch:
+    """get_match_score for every (resume, job description) pair as N x M arrays.
+
+    `cosine` and `overlap` hold the two score components and `scores` the
+    combined match % (rounded like JobIndex.match_scores). Columns follow
+    `labels`.
+    """
+
+    def __init__(self, cosine, overlap, labels):
+        self.cosine = cosine
+        self.overlap = overlap
+        self.scores = np.round((cosine * 0.7 + overlap * 0.3) * 100, 2)
+        self.labels = list(labels)
+
+    def __len__(self):
+        return self.scores.shape[0]
+
+    def best(self):
+        """(label, score) of each resume's best-matching JD (ties go to the earlier column)"""
+        if self.scores.shape[1] == 0:
+            return [None] * len(self)
+        cols = self.scores.argmax(axis=1)
+        return [(self.labels[c], float(self.scores[i, c])) for i, c in enumerate(cols.tolist())]
+
+    def top_k(self, k=3):
+        """Each resume's k best JDs as [(label, score), ...], best first"""
+        cols = np.argsort(-self.scores, axis=1, kind="stable")[:, :k]
+        return [
+            [(self.labels[c], float(self.scores[i, c])) for c in row]
+            for i, row in enumerate(cols.tolist())
+        ]
+
+
+def cross_match(resume_texts, job_descriptions=None, chunk_size=CROSS_MATCH_CHUNK_SIZE):
+    """Score every resume against every job description in chunked sparse products.
+
+    `job_descriptions` is a list of JD texts (labelled by position), a
+    {label: JD text} dict, or None for every role in roles.ROLES. Resumes are
+    tokenized and scored chunk_size at a time, so any iterable of texts works
+    and only the N x M result grows with N.
+    """
+    labels, jds = _job_set(job_descriptions)
+    jd_docs, jd_rankings = zip(*[job_tokens(jd) for jd in jds]) if jds else ((), ())
+    vocab = current_vocabulary()
+    jd_docs = [doc.in_vocabulary(vocab) for doc in jd_docs]
+    jd_keywords = [set(ranking.top(30)) for ranking in jd_rankings]
+    
+    cosine, overlap = [], []
+    resume_texts = iter(resume_texts)
+    while True:
+        chunk = [text for _, text in zip(range(chunk_size), resume_texts)]
+        if not chunk:
+            break
+        docs = [tokenize(text, vocab) for text in chunk]
+        matrix, terms = _term_count_matrix(jd_docs + docs)
+        cosine.append(_cross_cosine(matrix[len(jds):], matrix[:len(jds)]))
+        
+        # Top-30 keyword sets as binary matrices over the chunk's keyword columns
+        keyword_cols = np.flatnonzero([t not in ENGLISH_STOP_WORDS for t in terms])
+        keyword_counts = matrix[len(jds):, keyword_cols].tocsr()
+        keyword_counts.sort_indices()
+        keyword_terms = terms[keyword_cols]
+        fallback, top_30 = _batch_keywords(keyword_counts, chunk, docs)
+        jd_keyword_rows = np.zeros((len(jds), len(keyword_terms)), dtype=np.float32)
+        for j, keywords in enumerate(jd_keywords):
+            jd_keyword_rows[j] = np.isin(keyword_terms, list(keywords))
+        hits = (top_30 @ sparse.csr_matrix(jd_keyword_rows).T).toarray()
+        for i, keywords in fallback.items():
+            # Word-frequency fallback rows may hold words outside the keyword columns
+            hits[i] = [len(keywords & k) for k in jd_keywords]
+        overlap.append(_cross_overlap(hits, jd_keywords))
+    
+    if not cosine:
+        empty = np.zeros((0, len(jds)))
+        return CrossMatch(empty, empty.copy(), labels)
+    return CrossMatch(np.vstack(cosine), np.vstack(overlap), labels)
+
+
+def _job_set(job_descriptions):
+    """(labels, JD texts) for cross_match's job_descriptions argument"""
+    if job_descriptions is None:
+        return list(ROLES), [ROLES[role]["description"] for role in ROLES]
+    if isinstance(job_descriptions, dict):
+        return list(job_descriptions), list(job_descriptions.values())
+    job_descriptions = list(job_descriptions)
+    return list(range(len(job_descriptions))), job_descriptions
+
+
+def _cross_cosine(resumes, jds, r_total_sq=None):
+    """Pairwise-TF-IDF cosine of every resume row against every JD row (dense N x M).
+
+    The one implementation of the identity in the Job Index section; every
+    scorer (JobIndex, BatchMatch, ScreeningSession, cross_match) goes through
+    it. Pass `r_total_sq` (sum of squared counts per resume) when the resume
+    rows leave out terms that no JD has.
+    """
+    resumes = resumes.astype(np.float64)
+    jds = jds.astype(np.float64)
+    resumes_sq = resumes.multiply(resumes).tocsr()
+    jds_sq = jds.multiply(jds).tocsr()
+    resumes_binary = resumes.copy()
+    resumes_binary.data[:] = 1
+    jds_binary = jds.copy()
+    jds_binary.data[:] = 1
+    
+    dot = (resumes @ jds.T).toarray()
+    if r_total_sq is None:
+        r_total_sq = np.asarray(resumes_sq.sum(axis=1)).ravel()
+    r_total_sq = np.asarray(r_total_sq, dtype=np.float64)[:, None]
+    j_total_sq = np.asarray(jds_sq.sum(axis=1)).ravel()[None, :]
+    r_shared_sq = (resumes_sq @ jds_binary.T).toarray()
+    j_shared_sq = (resumes_binary @ jds_sq.T).toarray()
+    
+    r_norm_sq = PAIR_IDF_SQ * r_total_sq - (PAIR_IDF_SQ - 1) * r_shared_sq
+    j_norm_sq = PAIR_IDF_SQ * j_total_sq - (PAIR_IDF_SQ - 1) * j_shared_sq
+    denom = np.sqrt(r_norm_sq * j_norm_sq)
+    return np.divide(dot, denom, out=np.zeros_like(dot), where=denom > 0)
+
+
+def _cross_overlap(hits, jd_keywords):
+    """Keyword overlap from (resumes x JDs) top-30 hit counts"""
+    hits = hits.toarray() if sparse.issparse(hits) else np.asarray(hits, dtype=np.float64)
+    sizes = np.array([len(k) for k in jd_keywords], dtype=np.float64)[None, :]
+    return np.divide(hits, sizes, out=np.zeros(hits.shape), where=sizes > 0)
+
+
+# -------- Hashed Scoring (Out-of-Core) --------
+# Stateless alternative to the TF-IDF path: no fitted vocabulary, so memory stays
+# constant however many resumes are streamed through it
+HASH_FEATURES = int(os.environ.get("RESUME_HASH_FEATURES", 2 ** 20))
+HASH_CHUNK_SIZE = int(os.environ.get("RESUME_HASH_CHUNK_SIZE", 1000))
+
+
+class HashedScorer:
+    """Scores resumes against one JD by cosine of hashed term vectors.
+
+    Terms are tokenized like get_match_score (clean_text + the default token
+    pattern) and hashed into `n_features` dimensions; with `sublinear_tf` a
+    term's weight is 1 + log(count). There is no IDF, so a resume's score does
+    not depend on any other document. Scores are a 0-100 cosine percentage and
+    approximate the TF-IDF cosine; they are meant for triaging pools too large
+    to fit in memory, not to replace get_match_score.
+    """
+
+    def __init__(self, job_description, n_features=HASH_FEATURES, sublinear_tf=True):
+        self.n_features = n_features
+        self.sublinear_tf = sublinear_tf
+        self._vectorizer = HashingVectorizer(
+            n_features=n_features, alternate_sign=False, norm=None, dtype=np.float32
+        )
+        jd = self.vectorize([job_description])
+        self._jd = jd.toarray().ravel()
+        self._jd_norm = float(np.sqrt(jd.multiply(jd).sum()))
+
+    def vectorize(self, texts):
+        """Weighted (unnormalized) hashed term vectors of texts, one CSR row each"""
+        vectors = self._vectorizer.transform(clean_text(t) for t in texts)
+        if self.sublinear_tf:
+            np.log(vectors.data, out=vectors.data)
+            vectors.data += 1
+        return vectors
+
+    def score_texts(self, texts):
+        """Match % of each text against the JD, as an array"""
+        vectors = self.vectorize(texts)
+        norms = np.sqrt(np.asarray(vectors.multiply(vectors).sum(axis=1), dtype=np.float64).ravel())
+        dot = (vectors @ self._jd).astype(np.float64)
+        denom = norms * self._jd_norm
+        cosine = np.divide(dot, denom, out=np.zeros_like(dot), where=denom > 0)
+        return np.round(cosine * 100, 2)
+
+
+def stream_top_k(items, job_description, k=10, chunk_size=HASH_CHUNK_SIZE,
+                 n_features=HASH_FEATURES, sublinear_tf=True):
+    """Best k of an arbitrarily long stream of (key, text) pairs, by hashed-feature score.
+
+    Items are consumed lazily and scored `chunk_size` at a time; only the
+    current chunk and a k-sized heap are held, so memory does not grow with the
+    stream. Returns [(key, score)] best first (ties keep stream order).
+    """
+    scorer = HashedScorer(job_description, n_features, sublinear_tf)
+    heap = []
+    seq = 0
+    
+    def flush(chunk):
+        nonlocal seq
+        scores = scorer.score_texts([text for _, text in chunk])
+        for (key, _), score in zip(chunk, scores.tolist()):
+            # Min-heap on (score, -seq): the weakest, latest entry is evicted first
+            entry = (score, -seq, key)
+            seq += 1
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+    
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+    
+    return [(key, score) for score, _, key in sorted(heap, reverse=True)]
+
+
 # -------- Generate Improvement Suggestions --------
-def generate_suggestions(resume_text, job_description, missing_skills):
+def generate_suggestions(resume_text, job_description, missing_skills, context=None):
     """Generate personalized improvement suggestions"""
+    if context is None:
+        context = AnalysisContext(resume_text, job_description)
     suggestions = []
     
     # Skill-based suggestions
@@ -171,8 +1416,8 @@ def generate_suggestions(resume_text, job_description, missing_skills):
         })
     
     # Keyword suggestions
-    jd_keywords = extract_keywords(job_description, 15)
-    resume_keywords = extract_keywords(resume_text, 15)
+    jd_keywords = context.jd_keywords(15)
+    resume_keywords = context.resume_keywords(15)
     missing_kw = set(jd_keywords) - set(resume_keywords)
     
     if missing_kw:
@@ -184,7 +1429,7 @@ def generate_suggestions(resume_text, job_description, missing_skills):
         })
     
     # Length check
-    word_count = len(resume_text.split())
+    word_count = context.word_count
     if word_count < 300:
         suggestions.append({
             "category": "📄 Resume Length",
@@ -214,8 +1459,10 @@ def generate_suggestions(resume_text, job_description, missing_skills):
 
 
 # -------- Calculate Resume Strength --------
-def calculate_resume_strength(resume_data, job_description):
+def calculate_resume_strength(resume_data, job_description, context=None):
     """Calculate overall resume strength score"""
+    if context is None:
+        context = AnalysisContext(resume_data["text"], job_description)
     scores = {
         "completeness": 0,
         "relevance": 0,
@@ -229,7 +1476,7 @@ def calculate_resume_strength(resume_data, job_description):
     scores["completeness"] = (filled / len(required_fields)) * 25
     
     # Relevance to JD (out of 40)
-    match_score = get_match_score(resume_data["text"], job_description)
+    match_score = context.match_score
     scores["relevance"] = (match_score / 100) * 40
     
     # Experience (out of 20)
@@ -238,8 +1485,8 @@ def calculate_resume_strength(resume_data, job_description):
         scores["experience"] = min((exp / 5) * 20, 20)  # Max at 5 years
     
     # Keywords (out of 15)
-    jd_keywords = set(extract_keywords(job_description, 20))
-    resume_keywords = set(extract_keywords(resume_data["text"], 20))
+    jd_keywords = set(context.jd_keywords(20))
+    resume_keywords = set(context.resume_keywords(20))
     if jd_keywords:
         keyword_match = len(jd_keywords & resume_keywords) / len(jd_keywords)
         scores["keywords"] = keyword_match * 15
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from skills import get_taxonomy
+
+# Bump to force a full cache invalidation independently of source changes
+PARSER_VERSION = "1"
+
+# Where the cache lives and how large it may grow before LRU eviction kicks in
+PARSE_CACHE_PATH = os.environ.get(
+    "RESUME_PARSE_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "parse_cache.sqlite3")
+)
+PARSE_CACHE_MAX_BYTES = int(os.environ.get("RESUME_PARSE_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+# Source files whose contents determine the parse result (extractors + skill matching);
+# the loaded skills taxonomy is part of the version too
+VERSIONED_SOURCES = ["resume_parser.py", "skills.py"]
+
+
+# -------- Keys & Versioning --------
+def file_digest(content):
+    """Content hash of an uploaded file's raw bytes"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def compute_parser_version():
+    """Fingerprint of the extractor code and skills taxonomy; changes invalidate the cache"""
+    h = hashlib.sha256(PARSER_VERSION.encode("utf-8"))
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    for source in VERSIONED_SOURCES:
+        try:
+            with open(os.path.join(base_dir, source), "rb") as f:
+                h.update(f.read())
+        except OSError:
+            h.update(source.encode("utf-8"))
+    h.update(get_taxonomy().digest.encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+# -------- SQLite-backed Cache --------
+class ParseCache:
+    """Disk-backed cache of parse_resume() results keyed by file hash + parser version.
+
+    Entries hold the extracted text and the parsed fields. Total stored size is
+    capped at `max_bytes`; the least recently used entries are evicted first.
+    Entries written by a different parser version are dropped on open.
+    """
+
+    def __init__(self, path=PARSE_CACHE_PATH, max_bytes=PARSE_CACHE_MAX_BYTES, version=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.version = version or compute_parser_version()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    digest TEXT PRIMARY KEY,
+                    version TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    fields TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access)")
+            # Automatic invalidation: anything parsed by other extractor code is stale
+            self._conn.execute("DELETE FROM entries WHERE version != ?", (self.version,))
+
+    def get(self, digest):
+        """Return the cached parse result for a file digest, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, fields FROM entries WHERE digest = ? AND version = ?",
+                (digest, self.version)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE entries SET last_access = ? WHERE digest = ?",
+                    (time.time(), digest)
+                )
+            self.hits += 1
+
+        data = json.loads(row[1])
+        data["text"] = row[0]
+        return data
+
+    def put(self, digest, data):
+        """Store a parse result (the "text" key plus all parsed fields)"""
+        fields = {k: v for k, v in data.items() if k != "text"}
+        fields_json = json.dumps(fields)
+        text = data.get("text", "")
+        size = len(text.encode("utf-8")) + len(fields_json)
+        if size > self.max_bytes:
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (digest, version, text, fields, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (digest, self.version, text, fields_json, size, time.time())
+            )
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the total size fits the budget"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT digest, size FROM entries ORDER BY last_access ASC")
+        stale = []
+        for digest, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((digest,))
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE digest = ?", stale)
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+
+    def stats(self):
+        """Entry count, stored bytes and hit/miss counters"""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {
+            "entries": count,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "version": self.version
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    """Process-wide ParseCache at PARSE_CACHE_PATH (None if the cache can't be opened)
+
+    Reopened under the new version when the skills taxonomy has been reloaded.
+    """
+    global _default_cache
+    version = compute_parser_version()
+    with _default_cache_lock:
+        if _default_cache is not None and _default_cache.version != version:
+            # Not closed here: a batch in progress may still be using it
+            _default_cache = None
+        if _default_cache is None:
+            try:
+                _default_cache = ParseCache(version=version)
+            except (sqlite3.Error, OSError) as e:
+                print(f"Parse cache disabled: {e}")
+                return None
+        return _default_cache
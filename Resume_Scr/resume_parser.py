@@ -1,38 +1,459 @@
 import pdfplumber
+import PyPDF2
 import docx
 import re
 from datetime import datetime
 import io
+import os
+import time
+import zipfile
+from xml.etree import ElementTree
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import magic
+except (ImportError, OSError):  # python-magic or libmagic missing: use built-in signatures
+    magic = None
+
+from skills import extract_skills
+from parse_cache import file_digest
+
+# Number of worker processes used by parse_resumes_batch (None = one per CPU)
+BATCH_MAX_WORKERS = int(os.environ["RESUME_PARSER_WORKERS"]) if os.environ.get("RESUME_PARSER_WORKERS") else None
+
+# Upper bound on queued-but-unfinished files per worker, so batches stream
+BATCH_QUEUE_PER_WORKER = 4
+
+# Resume formats parse_resume understands (detected from content, not the file name)
+RESUME_TYPES = ("pdf", "docx", "txt")
+
+# ZIP ingestion limits
+ZIP_MAX_MEMBER_BYTES = 10 * 1024 * 1024
+ZIP_MAX_MEMBERS = 5000
+
+MIME_TYPES = {
+    "application/pdf": "pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+    "application/zip": "zip",
+    "application/x-zip-compressed": "zip",
+    "text/plain": "txt",
+}
+
+# Text formats that are markup rather than resume text
+MARKUP_MIME_TYPES = {"text/html", "text/xml", "application/xml", "text/rtf", "application/rtf"}
+MARKUP_SIGNATURES = (b"<!doctype", b"<html", b"<?xml", b"{\\rtf")
+
+# Extraction budget for PDFs: anything past this is almost certainly not a resume
+PDF_MAX_PAGES = 30
+PDF_MAX_CHARS = 200000
+
+# PDF text backend: "auto" (PyPDF2 first, pdfplumber for degraded pages), "pypdf2" or "pdfplumber"
+PDF_BACKEND = os.environ.get("RESUME_PDF_BACKEND", "auto")
+
+# A fast-backend page with less text than this (or mostly garbage) is re-extracted with pdfplumber
+PDF_MIN_PAGE_CHARS = 40
+
+# -------- Raw File Access --------
+def _read_upload(file):
+    """Read the raw bytes of an uploaded file without moving its cursor"""
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    position = file.tell()
+    file.seek(0)
+    content = file.read()
+    file.seek(position)
+    return content
+
+
+# -------- File Type Detection --------
+def detect_file_type(content):
+    """Sniff the type of a file from its bytes: "pdf", "docx", "txt", "zip" or None.
+
+    Uses libmagic (python-magic) when available and built-in signatures
+    otherwise. ZIP containers are told apart by their entries, since a DOCX
+    is a ZIP with a word/document.xml part. "txt" is plain text only: HTML,
+    XML and RTF are None. An empty file is an (empty) text file, as a .txt
+    upload always was.
+    """
+    if not content:
+        return "txt"
+    
+    kind = None
+    if magic is not None:
+        try:
+            mime = magic.from_buffer(content[:8192], mime=True)
+            if mime in MARKUP_MIME_TYPES:
+                return None
+            # Other text/* guesses (e.g. text/x-c for a resume listing C++) fall through to the sniff below
+            kind = MIME_TYPES.get(mime)
+        except Exception:
+            kind = None
+    
+    if kind is None:
+        if content.startswith(b"%PDF-"):
+            kind = "pdf"
+        elif content.startswith(b"PK\x03\x04"):
+            kind = "zip"
+        elif content[:1024].lstrip().lower().startswith(MARKUP_SIGNATURES):
+            return None
+        elif _looks_like_text(content[:8192]):
+            kind = "txt"
+    
+    if kind in ("zip", "docx"):
+        try:
+            with zipfile.ZipFile(io.BytesIO(content)) as archive:
+                kind = "docx" if "word/document.xml" in archive.namelist() else "zip"
+        except zipfile.BadZipFile:
+            return None
+    return kind
+
+
+def _looks_like_text(sample):
+    """Plain text: no NUL bytes and decodes as UTF-8 (or is mostly printable)"""
+    if b"\x00" in sample:
+        return False
+    try:
+        sample.decode("utf-8")
+        return True
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut at the end of the sample is fine
+        if e.start >= len(sample) - 3:
+            return True
+    printable = sum(32 <= b < 127 or b in (9, 10, 13) for b in sample)
+    return printable / len(sample) > 0.95
+
+
+# -------- ZIP Archive Ingestion --------
+def iter_zip_members(file, skipped=None, max_member_bytes=ZIP_MAX_MEMBER_BYTES, max_members=ZIP_MAX_MEMBERS,
+                     name=None):
+    """Yield (name, content) for each resume inside a ZIP archive, one member at a time.
+
+    Members are decompressed straight from the archive (nothing is written
+    to disk) and never more than one is held in memory. Directories, hidden
+    files, oversized members (by header size and by actual decompressed
+    bytes), nested archives and unsupported types are not yielded; each is
+    appended to `skipped` as {"name": ..., "reason": ...}. Member names are
+    prefixed with `name` (default: the archive's file name).
+    """
+    skipped = skipped if skipped is not None else []
+    archive_name = name or getattr(file, "name", None) or "archive.zip"
+    
+    with zipfile.ZipFile(file) as archive:
+        accepted = 0
+        for info in archive.infolist():
+            basename = os.path.basename(info.filename)
+            if info.is_dir() or not basename or basename.startswith(".") or "__MACOSX/" in info.filename:
+                continue
+            
+            member_name = f"{archive_name}/{info.filename}"
+            if accepted >= max_members:
+                skipped.append({"name": member_name, "reason": f"archive limit of {max_members} files reached"})
+                continue
+            if info.file_size > max_member_bytes:
+                skipped.append({"name": member_name, "reason": f"too large ({info.file_size:,} bytes)"})
+                continue
+            
+            try:
+                with archive.open(info) as member:
+                    content = member.read(max_member_bytes + 1)
+            except Exception as e:
+                skipped.append({"name": member_name, "reason": f"unreadable ({e})"})
+                continue
+            if len(content) > max_member_bytes:
+                skipped.append({"name": member_name, "reason": "too large when decompressed"})
+                continue
+            
+            kind = detect_file_type(content)
+            if not content:
+                skipped.append({"name": member_name, "reason": "empty file"})
+            elif kind == "zip":
+                skipped.append({"name": member_name, "reason": "nested archives are not supported"})
+            elif kind not in RESUME_TYPES:
+                skipped.append({"name": member_name, "reason": "unsupported file type"})
+            else:
+                accepted += 1
+                yield member_name, content
+
+
+# -------- PDF Text Backends --------
+def _pypdf2_pages(source, max_pages):
+    """Yield page text using PyPDF2 (fast, text-layer only)"""
+    reader = PyPDF2.PdfReader(io.BytesIO(source))
+    for page_number, page in enumerate(reader.pages):
+        if max_pages is not None and page_number >= max_pages:
+            break
+        yield page.extract_text() or ""
+
+
+def _pdfplumber_pages(source, max_pages):
+    """Yield page text using pdfplumber (slower, layout-aware)"""
+    pages = range(1, max_pages + 1) if max_pages is not None else None
+    with pdfplumber.open(io.BytesIO(source), pages=pages) as pdf:
+        for page in pdf.pages:
+            try:
+                yield page.extract_text() or ""
+            finally:
+                page.close()
+
+
+PDF_BACKENDS = {
+    "pypdf2": _pypdf2_pages,
+    "pdfplumber": _pdfplumber_pages,
+}
+
+
+def _looks_degraded(page_text):
+    """Heuristic check for fast-backend output that needs a pdfplumber retry"""
+    stripped = page_text.strip()
+    if len(stripped) < PDF_MIN_PAGE_CHARS:
+        return True
+    
+    # Unmapped glyphs / replacement characters
+    if "(cid:" in stripped or stripped.count("\ufffd") > len(stripped) * 0.01:
+        return True
+    
+    # Mostly non-text characters
+    readable = sum(c.isalnum() or c.isspace() or c in ".,;:()-/@+#&%'\"" for c in stripped)
+    if readable / len(stripped) < 0.85:
+        return True
+    
+    # Words run together (missing spaces between glyphs)
+    words = stripped.split()
+    if len(stripped) / len(words) > 25:
+        return True
+    
+    return False
+
+
+class _LazyPdfplumber:
+    """pdfplumber document opened on first fallback and reused for later pages"""
+
+    def __init__(self, source, max_pages):
+        self.source = source
+        self.max_pages = max_pages
+        self.pdf = None
+
+    def page_text(self, page_number):
+        if self.pdf is None:
+            pages = range(1, self.max_pages + 1) if self.max_pages is not None else None
+            self.pdf = pdfplumber.open(io.BytesIO(self.source), pages=pages)
+        page = self.pdf.pages[page_number]
+        try:
+            return page.extract_text() or ""
+        finally:
+            page.close()
+
+    def close(self):
+        if self.pdf is not None:
+            self.pdf.close()
+
+
+def _auto_pages(source, max_pages):
+    """Yield (text, backend) per page: PyPDF2 first, pdfplumber when the page looks degraded"""
+    fallback = _LazyPdfplumber(source, max_pages)
+    done = 0
+    try:
+        try:
+            for page_text in _pypdf2_pages(source, max_pages):
+                if _looks_degraded(page_text):
+                    retry = fallback.page_text(done)
+                    if retry.strip():
+                        done += 1
+                        yield retry, "pdfplumber"
+                        continue
+                done += 1
+                yield page_text, "pypdf2"
+        except Exception as e:
+            # PyPDF2 choked on the document: let pdfplumber handle the remaining pages
+            print(f"PyPDF2 failed ({e}), falling back to pdfplumber")
+            for page_number, page_text in enumerate(_pdfplumber_pages(source, max_pages)):
+                if page_number >= done:
+                    yield page_text, "pdfplumber"
+    finally:
+        fallback.close()
+
+
+def _read_pdf_source(file):
+    """Raw PDF bytes from a path, bytes or a file-like object"""
+    if isinstance(file, bytes):
+        return file
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            return f.read()
+    return _read_upload(file)
+
 
 # -------- Extract text from PDF --------
-def extract_text_from_pdf(file):
-    """Extract text from PDF file"""
-    text = ""
+def iter_pdf_pages(file, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS, backend=None):
+    """Yield (page_text, backend_name) for each PDF page in order, one page at a time.
+
+    `backend` is "auto" (PyPDF2 first, pdfplumber per page when the fast
+    output looks degraded), "pypdf2" or "pdfplumber"; defaults to PDF_BACKEND.
+    Stops early once `max_pages` pages or `max_chars` characters have been
+    produced (None disables a limit); the page that crosses the character
+    budget is truncated. Page objects are released as soon as their text is
+    extracted, so memory does not grow with page count.
+    """
+    backend = backend or PDF_BACKEND
+    source = _read_pdf_source(file)
+    if backend == "auto":
+        pages = _auto_pages(source, max_pages)
+    else:
+        pages = ((text, backend) for text in PDF_BACKENDS[backend](source, max_pages))
+    
+    chars = 0
+    for page_text, used in pages:
+        if not page_text:
+            continue
+        if max_chars is not None and chars + len(page_text) >= max_chars:
+            yield page_text[:max_chars - chars], used
+            return
+        chars += len(page_text)
+        yield page_text, used
+
+
+def _extract_pdf(file, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS, backend=None):
+    """Extract PDF text and report which backend(s) produced it"""
+    parts = []
+    used = []
     try:
-        with pdfplumber.open(file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        for page_text, page_backend in iter_pdf_pages(file, max_pages, max_chars, backend):
+            parts.append(page_text)
+            parts.append("\n")
+            if page_backend not in used:
+                used.append(page_backend)
     except Exception as e:
         print(f"Error extracting PDF: {e}")
-    return text
+    return "".join(parts), "+".join(used) or "none"
+
+
+def extract_text_from_pdf(file, max_pages=PDF_MAX_PAGES, max_chars=PDF_MAX_CHARS, backend=None):
+    """Extract text from PDF file"""
+    return _extract_pdf(file, max_pages, max_chars, backend)[0]
+
+
+def benchmark_pdf_backends(paths, backends=None, repeat=1):
+    """Measure pages/sec of each PDF backend over a sample corpus of PDF paths"""
+    sources = [_read_pdf_source(path) for path in paths]
+    results = {}
+    
+    for backend in backends or list(PDF_BACKENDS) + ["auto"]:
+        pages = 0
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for source in sources:
+                try:
+                    for _text, _used in iter_pdf_pages(source, None, None, backend):
+                        pages += 1
+                except Exception as e:
+                    print(f"{backend} failed on a sample: {e}")
+        elapsed = time.perf_counter() - start
+        results[backend] = {
+            "pages": pages,
+            "seconds": round(elapsed, 4),
+            "pages_per_sec": round(pages / elapsed, 1) if elapsed > 0 else 0.0
+        }
+    
+    return results
 
 
 # -------- Extract text from DOCX --------
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+DOCX_HEADER_PART = re.compile(r'word/header(\d*)\.xml$')
+DOCX_FOOTER_PART = re.compile(r'word/footer(\d*)\.xml$')
+
+
+def _docx_parts(archive):
+    """Text-bearing parts of a DOCX package: body first (the name is its first line), then headers and footers"""
+    names = archive.namelist()
+
+    def numbered(pattern):
+        found = [(int(m.group(1) or 0), name) for name in names for m in [pattern.match(name)] if m]
+        return [name for _, name in sorted(found)]
+
+    return ["word/document.xml"] + numbered(DOCX_HEADER_PART) + numbered(DOCX_FOOTER_PART)
+
+
+def iter_docx_paragraphs(file):
+    """Yield the text of each paragraph of a DOCX file in document order.
+
+    Streams the XML parts straight out of the ZIP with iterparse instead of
+    building the python-docx object model, and clears every finished
+    top-level block, so memory stays bounded by the largest single
+    paragraph or table. Covers body paragraphs, table cells, text boxes and
+    headers/footers (text boxes are read once, skipping the VML fallback copy).
+    Headers and footers come after the body, each distinct paragraph once:
+    the first/even/default variants usually repeat the same lines.
+    """
+    with zipfile.ZipFile(file) as archive:
+        body, *margins = _docx_parts(archive)
+        with archive.open(body) as stream:
+            yield from _iter_part_paragraphs(stream)
+        seen = set()
+        for part in margins:
+            with archive.open(part) as stream:
+                for paragraph in _iter_part_paragraphs(stream):
+                    if paragraph not in seen:
+                        seen.add(paragraph)
+                        yield paragraph
+
+
+def _iter_part_paragraphs(stream):
+    buffers = []  # one text buffer per open (possibly nested) paragraph
+    depth = 0
+    container = None
+    fallback_depth = 0
+
+    for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            depth += 1
+            if depth == 2:
+                container = elem  # w:body / w:hdr / w:ftr children live here
+            if tag == MC_FALLBACK:
+                fallback_depth += 1
+            elif tag == W_NS + "p" and not fallback_depth:
+                buffers.append([])
+            continue
+
+        depth -= 1
+        if tag == MC_FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth or not buffers:
+            pass
+        elif tag == W_NS + "t":
+            buffers[-1].append(elem.text or "")
+        elif tag == W_NS + "tab":
+            buffers[-1].append("\t")
+        elif tag in (W_NS + "br", W_NS + "cr"):
+            buffers[-1].append("\n")
+        elif tag == W_NS + "p":
+            yield "".join(buffers.pop())
+
+        # A top-level block (paragraph, table, section) is done: drop it
+        if depth == 2 and container is not None:
+            container.clear()
+        elif depth == 1:
+            elem.clear()
+
+
 def extract_text_from_docx(file):
     """Extract text from DOCX file"""
     try:
-        doc = docx.Document(file)
-        text = ""
-        for para in doc.paragraphs:
-            text += para.text + "\n"
-        return text
+        return "".join(paragraph + "\n" for paragraph in iter_docx_paragraphs(file))
     except Exception as e:
         print(f"Error extracting DOCX: {e}")
         return ""
 
 
+def _extract_text_from_docx_dom(file):
+    """python-docx body-paragraph extraction (the previous implementation, kept for benchmarks)"""
+    doc = docx.Document(file)
+    return "".join(para.text + "\n" for para in doc.paragraphs)
+
+
 # -------- Extract text from TXT --------
 def extract_text_from_txt(file):
     """Extract text from TXT file"""
@@ -48,28 +469,132 @@ def extract_text_from_txt(file):
         return ""
 
 
+# -------- Precompiled Patterns --------
+# Local part capped at 64 chars (RFC 5321) so long symbol runs can't cause quadratic scans
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+PHONE_PATTERNS = [
+    re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # US/International
+    re.compile(r'\d{10}'),  # 10 digits
+    re.compile(r'\+\d{12}'),  # International with +
+]
+
+NAME_SKIP_WORDS = ['resume', 'cv', 'curriculum', 'vitae', 'profile', 'contact', 'objective']
+
+# Pattern: "X years of experience" or "X+ years" (matched against lowercased text).
+# (?<!\d) only tries digit runs from their first digit, keeping long numbers linear, and
+# no two adjacent \s* can share a whitespace run (which would be quadratic in its length).
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(?<!\d)(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)'),
+    re.compile(r'experience[:\s]+(\d+)\+?\s*(?:years?|yrs?)'),
+    re.compile(r'(?<!\d)(\d+)\+?\s*(?:years?|yrs?)\s*experience'),
+]
+
+# Pattern for date ranges: "2020 - 2023", "Jan 2020 - Present", etc.
+DATE_RANGE_PATTERN = re.compile(r'(\d{4})\s*[-–—]\s*(\d{4}|present|current)')
+
+EDUCATION_KEYWORDS = {
+    "PhD": ["phd", "ph.d", "doctorate", "doctoral"],
+    "Master's": ["master", "msc", "m.sc", "mba", "m.tech", "m.s"],
+    "Bachelor's": ["bachelor", "bsc", "b.sc", "b.tech", "b.e", "b.s", "undergraduate"],
+    "Diploma": ["diploma", "associate"],
+}
+EDUCATION_HIERARCHY = ["PhD", "Master's", "Bachelor's", "Diploma"]
+
+# One zero-width alternation over every degree keyword, tried at each position.
+# Groups follow EDUCATION_HIERARCHY, so a position reports its highest degree.
+EDUCATION_PATTERN = re.compile("(?=" + "|".join(
+    f"(?P<edu{rank}>" + "|".join(re.escape(k) for k in EDUCATION_KEYWORDS[degree]) + ")"
+    for rank, degree in enumerate(EDUCATION_HIERARCHY)
+) + ")")
+
+# Runs of lowercase words on one line; scanned once, no nested backtracking
+WORD_RUN_PATTERN = re.compile(r'[a-z]+(?:[ \t]+[a-z]+)*')
+UNIVERSITY_MAX_WORDS = 4
+UNIVERSITY_STOP_WORDS = {"at", "from", "in", "and", "with", "of", "for", "graduated", "studied", "attended", "degree"}
+
+CERT_KEYWORDS = [
+    "aws certified", "azure certified", "google cloud certified",
+    "pmp", "cissp", "comptia", "certified", "certification",
+    "coursera", "udacity", "nanodegree"
+]
+CERT_PATTERN = re.compile("|".join(re.escape(k) for k in CERT_KEYWORDS))
+
+PROJECT_KEYWORDS = ['projects', 'project work', 'key projects']
+NUMBERED_ITEM_PATTERN = re.compile(r'\n\d+\.')
+
+# Heading aliases for the sections the extractors care about
+SECTION_HEADINGS = {
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "career history", "relevant experience"],
+    "education": ["education", "academic background", "academics", "qualifications",
+                  "educational qualifications", "academic qualifications", "education and training"],
+    "projects": ["projects", "key projects", "project work", "personal projects",
+                 "academic projects", "selected projects"],
+    "skills": ["skills", "technical skills", "core skills", "key skills", "skill set",
+               "core competencies", "technologies", "tools and technologies"],
+    "certifications": ["certifications", "certification", "certificates", "courses",
+                       "licenses and certifications", "certifications and courses", "training"],
+}
+
+# Other common headings: they only close the previous section
+OTHER_HEADINGS = [
+    "summary", "professional summary", "objective", "career objective", "profile", "about me",
+    "achievements", "awards", "honors", "publications", "interests", "hobbies", "languages",
+    "references", "contact", "personal details", "volunteering", "activities", "leadership"
+]
+
+HEADING_INDEX = {alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases}
+HEADING_INDEX.update({alias: None for alias in OTHER_HEADINGS})
+HEADING_MAX_CHARS = 50
+HEADING_CLEAN_PATTERN = re.compile(r'[^a-z ]+')
+
+
+# Wall-clock budget (seconds) shared by all field extractors for one document
+REGEX_TIME_BUDGET = float(os.environ.get("RESUME_REGEX_BUDGET", 1.0))
+
+# How often (in lines / word runs) the line-based extractors re-check the budget
+BUDGET_CHECK_INTERVAL = 256
+
+
+# -------- Per-document Extraction Budget --------
+class ExtractionBudget:
+    """Wall-clock budget for the regex-driven extractors of one document.
+
+    Extractors run in order until the deadline passes; the rest fall back to
+    their "not found" defaults and are listed in `skipped`, so one pathological
+    resume can't stall a batch. A budget of None/0 disables the deadline.
+    """
+
+    def __init__(self, seconds=REGEX_TIME_BUDGET):
+        self.deadline = time.perf_counter() + seconds if seconds else None
+        self.skipped = []
+
+    def expired(self):
+        return self.deadline is not None and time.perf_counter() > self.deadline
+
+    def run(self, field, extractor, default, *args):
+        """Run one extractor unless the budget is already spent"""
+        if self.expired():
+            self.skipped.append(field)
+            return default
+        return extractor(*args)
+
+
 # -------- Extract Email --------
 def extract_email(text):
     """Extract email address from text"""
-    pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    matches = re.findall(pattern, text)
-    return matches[0] if matches else "Not Found"
+    match = EMAIL_PATTERN.search(text)
+    return match.group(0) if match else "Not Found"
 
 
 # -------- Extract Phone Number --------
 def extract_phone(text):
     """Extract phone number from text"""
-    # Pattern for various phone formats
-    patterns = [
-        r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US/International
-        r'\d{10}',  # 10 digits
-        r'\+\d{12}',  # International with +
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            return matches[0]
+    for pattern in PHONE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
     
     return "Not Found"
 
@@ -77,14 +602,18 @@ def extract_phone(text):
 # -------- Extract Name (Improved) --------
 def extract_name(text):
     """Extract name from resume using improved heuristics"""
-    lines = text.split("\n")
-    
+    lines = text.split("\n")[:10]
+    return _name_from_lines(lines, [line.lower() for line in lines])
+
+
+def _name_from_lines(lines, lines_lower):
+    """Name heuristics over the first lines (original and lowercased)"""
     # Try first few non-empty lines
-    for line in lines[:10]:
+    for line, line_lower in zip(lines, lines_lower):
         line = line.strip()
         
         # Skip empty lines, emails, phones, URLs
-        if not line or '@' in line or 'http' in line.lower():
+        if not line or '@' in line or 'http' in line_lower:
             continue
             
         # Skip lines with too many numbers (likely phone/address)
@@ -92,8 +621,7 @@ def extract_name(text):
             continue
             
         # Skip common headers
-        skip_words = ['resume', 'cv', 'curriculum', 'vitae', 'profile', 'contact', 'objective']
-        if any(word in line.lower() for word in skip_words):
+        if any(word in line_lower for word in NAME_SKIP_WORDS):
             continue
         
         # Name is usually 2-4 words, mostly alphabetic
@@ -109,22 +637,20 @@ def extract_name(text):
 # -------- Extract Experience (Years) --------
 def extract_experience(text):
     """Extract years of experience from resume"""
-    text_lower = text.lower()
-    
-    # Pattern: "X years of experience" or "X+ years"
-    patterns = [
-        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)',
-        r'experience[:\s]+(\d+)\+?\s*(?:years?|yrs?)',
-        r'(\d+)\+?\s*(?:years?|yrs?)\s*experience'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text_lower)
+    return _experience_from_lower(text.lower())
+
+
+def _experience_from_lower(text_lower, history_lower=None, budget=None):
+    for pattern in EXPERIENCE_PATTERNS:
+        if budget is not None and budget.expired():
+            budget.skipped.append("experience_years")
+            return "Not Specified"
+        match = pattern.search(text_lower)
         if match:
             return int(match.group(1))
     
-    # Alternative: Calculate from work history dates
-    years = extract_years_from_dates(text)
+    # Alternative: Calculate from work history dates (the experience section when known)
+    years = _years_from_dates_lower(text_lower if history_lower is None else history_lower, budget)
     if years:
         return years
     
@@ -133,17 +659,19 @@ def extract_experience(text):
 
 def extract_years_from_dates(text):
     """Calculate experience from date ranges in resume"""
-    # Pattern for date ranges: "2020 - 2023", "Jan 2020 - Present", etc.
-    date_pattern = r'(\d{4})\s*[-–—]\s*(\d{4}|present|current)'
-    matches = re.findall(date_pattern, text.lower())
-    
-    if not matches:
-        return None
-    
+    return _years_from_dates_lower(text.lower())
+
+
+def _years_from_dates_lower(text_lower, budget=None):
     total_years = 0
     current_year = datetime.now().year
     
-    for start, end in matches:
+    for count, match in enumerate(DATE_RANGE_PATTERN.finditer(text_lower)):
+        if budget is not None and count % BUDGET_CHECK_INTERVAL == 0 and count and budget.expired():
+            # A partial sum would understate the experience, so report nothing
+            budget.skipped.append("experience_years")
+            return None
+        start, end = match.groups()
         start_year = int(start)
         end_year = current_year if end in ['present', 'current'] else int(end)
         total_years += max(0, end_year - start_year)
@@ -154,132 +682,435 @@ def extract_years_from_dates(text):
 # -------- Extract Education --------
 def extract_education(text):
     """Extract education level from resume"""
-    text_lower = text.lower()
-    
-    education_keywords = {
-        "PhD": ["phd", "ph.d", "doctorate", "doctoral"],
-        "Master's": ["master", "msc", "m.sc", "mba", "m.tech", "m.s"],
-        "Bachelor's": ["bachelor", "bsc", "b.sc", "b.tech", "b.e", "b.s", "undergraduate"],
-        "Diploma": ["diploma", "associate"],
-    }
-    
-    found_education = []
-    
-    for degree, keywords in education_keywords.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                found_education.append(degree)
+    return _education_from_lower(text.lower())
+
+
+def _education_from_lower(text_lower):
+    best = len(EDUCATION_HIERARCHY)
+    for match in EDUCATION_PATTERN.finditer(text_lower):
+        rank = int(match.lastgroup[3:])
+        if rank < best:
+            best = rank
+            if best == 0:
                 break
     
-    # Remove duplicates and return highest degree
-    education_hierarchy = ["PhD", "Master's", "Bachelor's", "Diploma"]
-    for edu in education_hierarchy:
-        if edu in found_education:
-            return edu
-    
-    return "Not Specified"
+    return EDUCATION_HIERARCHY[best] if best < len(EDUCATION_HIERARCHY) else "Not Specified"
 
 
 # -------- Extract Universities/Colleges --------
 def extract_universities(text):
     """Extract university/college names from resume"""
-    # Common university keywords
-    uni_patterns = [
-        r'university of [a-z\s]+',
-        r'[a-z\s]+ university',
-        r'[a-z\s]+ institute of technology',
-        r'iit [a-z]+',
-        r'nit [a-z]+',
-    ]
-    
+    return _universities_from_lower(text.lower())
+
+
+def _universities_from_lower(text_lower, budget=None):
+    """Token-window scan for institution names around anchor words.
+
+    Each run of words is scanned once: "university of X", "X university",
+    "X institute of technology", "iit X" and "nit X", taking at most
+    UNIVERSITY_MAX_WORDS words on the open side. Linear in the text length.
+    """
     universities = []
-    text_lower = text.lower()
-    
-    for pattern in uni_patterns:
-        matches = re.findall(pattern, text_lower)
-        universities.extend([m.title() for m in matches])
+    for count, run in enumerate(WORD_RUN_PATTERN.finditer(text_lower)):
+        if budget is not None and count % BUDGET_CHECK_INTERVAL == 0 and count and budget.expired():
+            budget.skipped.append("universities")
+            break
+        words = run.group(0).split()
+        for i, word in enumerate(words):
+            name = None
+            if word == "university":
+                if i + 2 < len(words) and words[i + 1] == "of":
+                    name = ["university", "of"] + _window_after(words, i + 2)
+                else:
+                    before = _window_before(words, i)
+                    if before:
+                        name = before + ["university"]
+            elif word == "institute" and words[i + 1:i + 3] == ["of", "technology"]:
+                before = _window_before(words, i)
+                if before:
+                    name = before + ["institute", "of", "technology"]
+            elif word in ("iit", "nit") and i + 1 < len(words):
+                name = [word, words[i + 1]]
+            
+            if name:
+                title = " ".join(name).title()
+                if title not in universities:
+                    universities.append(title)
+                    if len(universities) == 3:
+                        return universities  # Return top 3
     
-    # Remove duplicates
-    return list(set(universities))[:3]  # Return top 3
+    return universities
+
+
+def _window_before(words, anchor):
+    """Up to UNIVERSITY_MAX_WORDS words preceding the anchor, stopping at filler words"""
+    start = anchor
+    while start > 0 and anchor - start < UNIVERSITY_MAX_WORDS and words[start - 1] not in UNIVERSITY_STOP_WORDS:
+        start -= 1
+    return words[start:anchor]
+
+
+def _window_after(words, begin):
+    """Up to UNIVERSITY_MAX_WORDS words from `begin`, stopping at filler words"""
+    end = begin
+    while end < len(words) and end - begin < UNIVERSITY_MAX_WORDS and words[end] not in UNIVERSITY_STOP_WORDS:
+        end += 1
+    return words[begin:end]
 
 
 # -------- Extract Certifications --------
 def extract_certifications(text):
     """Extract certifications from resume"""
-    cert_keywords = [
-        "aws certified", "azure certified", "google cloud certified",
-        "pmp", "cissp", "comptia", "certified", "certification",
-        "coursera", "udacity", "nanodegree"
-    ]
-    
-    text_lower = text.lower()
+    return _certifications_from_lines(text.split('\n'), text.lower().split('\n'))
+
+
+def _certifications_from_lines(lines, lines_lower, budget=None):
     found_certs = []
-    
-    lines = text.split('\n')
-    for line in lines:
-        line_lower = line.lower()
-        for cert in cert_keywords:
-            if cert in line_lower and len(line) < 150:
-                found_certs.append(line.strip())
+    for count, (line, line_lower) in enumerate(zip(lines, lines_lower)):
+        if budget is not None and count % BUDGET_CHECK_INTERVAL == 0 and count and budget.expired():
+            budget.skipped.append("certifications")
+            break
+        if len(line) < 150 and CERT_PATTERN.search(line_lower):
+            found_certs.append(line.strip())
+            if len(found_certs) == 5:
                 break
     
-    return found_certs[:5]  # Return top 5
+    return found_certs  # Return top 5
 
 
 # -------- Extract Projects --------
 def extract_projects(text):
     """Extract project count from resume"""
-    text_lower = text.lower()
+    return _projects_from_lower(text.lower())
+
+
+def _projects_from_lower(text_lower, section_lower=None):
+    # Segmented projects section: count items up to the next heading
+    if section_lower is not None:
+        return _count_items(section_lower[:1000])
     
     # Look for "projects" section
-    project_keywords = ['projects', 'project work', 'key projects']
-    
-    for keyword in project_keywords:
-        if keyword in text_lower:
-            # Count bullet points or numbered items after "projects"
-            idx = text_lower.find(keyword)
-            section = text_lower[idx:idx+1000]  # Next 1000 chars
-            
-            # Count bullets/numbers
-            bullets = section.count('•') + section.count('*') + section.count('-')
-            numbers = len(re.findall(r'\n\d+\.', section))
-            
-            project_count = max(bullets, numbers)
+    for keyword in PROJECT_KEYWORDS:
+        idx = text_lower.find(keyword)
+        if idx != -1:
+            # Count bullets/numbers in the next 1000 chars
+            project_count = _count_items(text_lower[idx:idx+1000])
             if project_count > 0:
                 return project_count
     
     return 0
 
 
-# -------- Main Parser Function --------
-def parse_resume(file):
-    """Main function to parse resume and extract all information"""
-    filename = file.name.lower()
+def _count_items(section):
+    """Count bullets or numbered items in a section of text"""
+    bullets = section.count('•') + section.count('*') + section.count('-')
+    numbers = len(NUMBERED_ITEM_PATTERN.findall(section))
+    return max(bullets, numbers)
+
+
+# -------- Section Segmentation --------
+def _heading_of(line_lower):
+    """Return (section, inline) if the line is a heading, else None.
+
+    section is None for headings that only close the previous section;
+    inline is True for "Skills: python, sql" style lines.
+    """
+    stripped = line_lower.strip()
+    if not stripped or len(stripped) > HEADING_MAX_CHARS * 4:
+        return None
     
-    # Extract text based on file type
-    if filename.endswith(".pdf"):
-        text = extract_text_from_pdf(file)
-    elif filename.endswith(".docx"):
-        text = extract_text_from_docx(file)
-    elif filename.endswith(".txt"):
-        text = extract_text_from_txt(file)
-    else:
+    head, sep, rest = stripped.partition(":")
+    if len(head) > HEADING_MAX_CHARS:
+        return None
+    key = " ".join(HEADING_CLEAN_PATTERN.sub(" ", head.replace("&", " and ")).split())
+    if key not in HEADING_INDEX:
+        return None
+    if not sep and len(stripped) > HEADING_MAX_CHARS:
         return None
+    return HEADING_INDEX[key], bool(rest.strip())
+
+
+def _segment_lines(lines_lower):
+    """Line ranges of headed sections: {section: [(heading_line, body_start, body_end), ...]}"""
+    index = {}
+    current = None
+    for i, line_lower in enumerate(lines_lower):
+        heading = _heading_of(line_lower)
+        if heading is None:
+            continue
+        if current is not None:
+            current[2] = i
+        section, inline = heading
+        if section is None:
+            current = None
+            continue
+        current = [i, i if inline else i + 1, len(lines_lower)]
+        index.setdefault(section, []).append(current)
+    
+    return {section: [tuple(span) for span in spans] for section, spans in index.items()}
+
+
+def _line_offsets(lines):
+    """Character offset of the start of each line (plus the end of text)"""
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line) + 1)
+    offsets[-1] -= 1
+    return offsets
+
+
+def segment_sections(text):
+    """Offset index of headed resume sections.
+
+    Returns {section: [[start, end], ...]} where each pair is a character
+    range of `text` holding the section body (the heading line itself is
+    excluded unless the content follows it on the same line). Sections are
+    experience, education, projects, skills and certifications.
+    """
+    lines = text.split("\n")
+    spans = _segment_lines(text.lower().split("\n"))
+    return _spans_to_offsets(spans, _line_offsets(lines))
+
+
+def _spans_to_offsets(spans, offsets):
+    last = len(offsets) - 1
+    return {
+        section: [[offsets[start], offsets[end] - (end < last)] for _, start, end in ranges]
+        for section, ranges in spans.items()
+    }
+
+
+def _section_lines(spans, section, lines, lines_lower):
+    """Body lines of every occurrence of a section, or None if it wasn't found"""
+    if section not in spans:
+        return None
+    body, body_lower = [], []
+    for _, start, end in spans[section]:
+        body.extend(lines[start:end])
+        body_lower.extend(lines_lower[start:end])
+    return body, body_lower
+
+
+def _section_text(spans, section, lines_lower, include_heading=False):
+    """Lowercased text of a section (heading line optionally included), or None"""
+    if section not in spans:
+        return None
+    return "\n".join(
+        "\n".join(lines_lower[heading if include_heading else start:end])
+        for heading, start, end in spans[section]
+    )
+
+
+# -------- Fused Field Extraction --------
+def extract_fields(text, budget=None):
+    """Extract every parsed field from one normalization of the text.
+
+    Lowercases and splits the text once and segments it into headed
+    sections (see segment_sections). Extractors then run on their own
+    section when it exists: work-history dates on experience, degrees and
+    universities on education, certifications and projects on their
+    sections; otherwise they fall back to the whole text. All extractors
+    share one ExtractionBudget; fields it had to skip keep their default
+    value. The section offsets are returned under "sections".
+    """
+    budget = budget or ExtractionBudget()
+    text_lower = text.lower()
+    lines = text.split("\n")
+    lines_lower = text_lower.split("\n")
+    spans = _segment_lines(lines_lower)
+    
+    education_lower = _section_text(spans, "education", lines_lower)
+    if education_lower is None:
+        education_lower = text_lower
+    cert_lines = _section_lines(spans, "certifications", lines, lines_lower) or (lines, lines_lower)
     
-    # Extract all information
     return {
-        "name": extract_name(text),
-        "email": extract_email(text),
-        "phone": extract_phone(text),
-        "experience_years": extract_experience(text),
-        "education": extract_education(text),
-        "universities": extract_universities(text),
-        "certifications": extract_certifications(text),
-        "project_count": extract_projects(text),
-        "text": text
+        "name": budget.run("name", _name_from_lines, "Name Not Found", lines[:10], lines_lower[:10]),
+        "email": budget.run("email", extract_email, "Not Found", text),
+        "phone": budget.run("phone", extract_phone, "Not Found", text),
+        "experience_years": budget.run("experience_years", _experience_from_lower, "Not Specified",
+                                       text_lower, _section_text(spans, "experience", lines_lower), budget),
+        "education": budget.run("education", _education_from_lower, "Not Specified", education_lower),
+        "universities": budget.run("universities", _universities_from_lower, [], education_lower, budget),
+        "certifications": budget.run("certifications", _certifications_from_lines, [], *cert_lines, budget),
+        "project_count": budget.run("project_count", _projects_from_lower, 0, text_lower,
+                                    _section_text(spans, "projects", lines_lower, include_heading=True)),
+        "sections": _spans_to_offsets(spans, _line_offsets(lines)),
     }
 
 
+# -------- Main Parser Function --------
+def _extract_text(content, kind):
+    """(text, backend) of a resume's raw bytes of a known type"""
+    source = io.BytesIO(content)
+    if kind == "pdf":
+        return _extract_pdf(source)
+    elif kind == "docx":
+        return extract_text_from_docx(source), "docx-xml"
+    else:
+        return extract_text_from_txt(source), "txt"
+
+
+def extract_resume_text(content):
+    """Plain text of a resume's raw bytes without field extraction (None if unsupported)"""
+    kind = detect_file_type(content)
+    if kind not in RESUME_TYPES:
+        return None
+    return _extract_text(content, kind)[0]
+
+
+def parse_resume(file, cache=None):
+    """Main function to parse resume and extract all information
+
+    The format is detected from the file contents (see detect_file_type),
+    so misnamed files still parse; anything that isn't a PDF, DOCX or text
+    file returns None. If a ParseCache is given, results are looked up by a
+    hash of the file bytes first, so re-uploads skip text extraction entirely.
+    """
+    content = _read_upload(file)
+    kind = detect_file_type(content)
+    if kind not in RESUME_TYPES:
+        return None
+    
+    digest = None
+    if cache is not None:
+        digest = file_digest(content)
+        cached = cache.get(digest)
+        if cached is not None:
+            return cached
+    
+    # Extract text based on file type
+    text, backend = _extract_text(content, kind)
+    
+    # Extract all information
+    budget = ExtractionBudget()
+    data = extract_fields(text, budget)
+    data["skipped_fields"] = budget.skipped
+    data["text_backend"] = backend
+    data["text"] = text
+    
+    # Timed-out results depend on machine load, so they are never cached
+    if cache is not None and not budget.skipped:
+        cache.put(digest, data)
+    return data
+
+
+# -------- Batch Parsing (Process Pool) --------
+def _parse_resume_bytes(name, content):
+    """Parse one resume from raw bytes and attach its skills (runs in a worker process)"""
+    buffer = io.BytesIO(content)
+    buffer.name = name
+    data = parse_resume(buffer)
+    if data:
+        data["skills"] = extract_skills(data["text"])
+    return data
+
+
+def _store_parsed(cache, digest, data):
+    """Write a worker result to the parse cache (skills are recomputed on hits)"""
+    if cache is not None and data and not data.get("skipped_fields"):
+        cache.put(digest, {k: v for k, v in data.items() if k != "skills"})
+
+
+def _iter_named_bytes(files):
+    """Normalize uploaded files and (name, bytes) pairs to (name, bytes)"""
+    for item in files:
+        if isinstance(item, tuple):
+            yield item
+        else:
+            yield getattr(item, "name", ""), _read_upload(item)
+
+
+def parse_resumes_batch(files, max_workers=None, cache=None, skipped=None):
+    """Parse many resumes in a process pool.
+
+    `files` is any iterable of uploaded files or (name, bytes) pairs, such
+    as iter_zip_members(); it is consumed lazily with at most
+    BATCH_QUEUE_PER_WORKER files per worker waiting in the pool.
+    Yields (index, resume_data) tuples in completion order, where index is
+    the position of the file in `files` and resume_data is the
+    parse_resume() dict with "skills" attached (or None for unsupported
+    files). Each result is identical to calling parse_resume() +
+    extract_skills() serially. Cache hits are served from the parent
+    process without touching the pool. A file whose parse fails (including
+    a crashed worker) yields None and is appended to `skipped` as
+    {"name": ..., "reason": ...}; the rest of the batch carries on.
+    """
+    skipped = skipped if skipped is not None else []
+    workers = max_workers or BATCH_MAX_WORKERS or os.cpu_count() or 1
+    if hasattr(files, "__len__"):
+        workers = min(workers, len(files))
+    
+    pool = None
+    in_flight = {}
+    
+    def finished(return_when):
+        nonlocal pool
+        done, _ = wait(in_flight, return_when=return_when)
+        for future in done:
+            idx, digest, name, owner = in_flight.pop(future)
+            try:
+                data = future.result()
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory): every file queued in that pool
+                # is lost, and the next file starts a fresh pool
+                skipped.append({"name": name, "reason": "parser process crashed"})
+                if owner is pool:
+                    pool.shutdown(cancel_futures=True)
+                    pool = None
+                yield idx, None
+                continue
+            except Exception as e:
+                skipped.append({"name": name, "reason": f"could not be parsed ({e})"})
+                yield idx, None
+                continue
+            _store_parsed(cache, digest, data)
+            yield idx, data
+    
+    try:
+        for idx, (name, content) in enumerate(_iter_named_bytes(files)):
+            if detect_file_type(content) not in RESUME_TYPES:
+                yield idx, None
+                continue
+            digest = file_digest(content) if cache is not None else None
+            cached = cache.get(digest) if cache is not None else None
+            if cached is not None:
+                cached["skills"] = extract_skills(cached["text"])
+                yield idx, cached
+                continue
+            
+            # Not worth starting a pool for a single worker
+            if workers <= 1:
+                try:
+                    data = _parse_resume_bytes(name, content)
+                except Exception as e:
+                    skipped.append({"name": name, "reason": f"could not be parsed ({e})"})
+                    yield idx, None
+                    continue
+                _store_parsed(cache, digest, data)
+                yield idx, data
+                continue
+            
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=workers)
+            try:
+                future = pool.submit(_parse_resume_bytes, name, content)
+            except BrokenProcessPool:
+                # Its lost files are reported as their futures are collected
+                pool.shutdown(cancel_futures=True)
+                pool = ProcessPoolExecutor(max_workers=workers)
+                future = pool.submit(_parse_resume_bytes, name, content)
+            in_flight[future] = (idx, digest, name, pool)
+            if len(in_flight) >= workers * BATCH_QUEUE_PER_WORKER:
+                yield from finished(FIRST_COMPLETED)
+        
+        while in_flight:
+            yield from finished(FIRST_COMPLETED)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
 # -------- Calculate ATS Score --------
 def calculate_ats_score(resume_data):
     """Calculate ATS (Applicant Tracking System) score"""
@@ -1,3 +1,10 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from skills import extract_skills, get_taxonomy
+
 ROLES = {
     # Data & Analytics Roles
     "Data Scientist": {
@@ -167,20 +174,132 @@ ROLES = {
 }
 
 
+# Role category -> roles in it; roles not listed fall under "Other"
+ROLE_CATEGORIES = {
+    "Data & Analytics": ["Data Scientist", "Data Analyst", "Data Engineer", "Business Intelligence Analyst"],
+    "Software Development": ["Full Stack Developer", "Frontend Developer", "Backend Developer", "Mobile Developer"],
+    "ML & AI": ["Machine Learning Engineer", "AI Research Scientist", "NLP Engineer", "Computer Vision Engineer"],
+    "Cloud & Infrastructure": ["Cloud Engineer", "Cloud Architect", "DevOps Engineer", "Site Reliability Engineer"],
+    "Security": ["Cybersecurity Analyst", "Security Engineer"],
+    "Management": ["Product Manager", "Technical Project Manager"],
+    "QA & Testing": ["QA Engineer", "SDET"],
+    "Other": ["Blockchain Developer", "Database Administrator", "UI/UX Designer"]
+}
+
+_ROLE_CATEGORY = {role: category for category, roles in ROLE_CATEGORIES.items() for role in roles}
+
+
 def get_role_category(role_name):
     """Categorize roles by domain"""
-    categories = {
-        "Data & Analytics": ["Data Scientist", "Data Analyst", "Data Engineer", "Business Intelligence Analyst"],
-        "Software Development": ["Full Stack Developer", "Frontend Developer", "Backend Developer", "Mobile Developer"],
-        "ML & AI": ["Machine Learning Engineer", "AI Research Scientist", "NLP Engineer", "Computer Vision Engineer"],
-        "Cloud & Infrastructure": ["Cloud Engineer", "Cloud Architect", "DevOps Engineer", "Site Reliability Engineer"],
-        "Security": ["Cybersecurity Analyst", "Security Engineer"],
-        "Management": ["Product Manager", "Technical Project Manager"],
-        "QA & Testing": ["QA Engineer", "SDET"],
-        "Other": ["Blockchain Developer", "Database Administrator", "UI/UX Designer"]
-    }
-    
-    for category, roles in categories.items():
-        if role_name in roles:
-            return category
-    return "Other"
\ No newline at end of file
+    return _ROLE_CATEGORY.get(role_name, "Other")
+
+
+# -------- Role Catalog --------
+class RoleProfile:
+    """One role's job description with everything derived from it computed once.
+
+    tokens   - nlp_engine.TokenizedText of the description (its term vector)
+    ranking  - nlp_engine.KeywordRanking of the description
+    keywords - top-30 ranked keywords
+    skills   - extract_skills(description)
+
+    A custom JD passes its stored `analysis` ({"skills", "keywords", "vector",
+    "taxonomy"}, see jd_library) instead: tokens come from the stored
+    term-count vector rather than tokenizing the description again, unless its
+    keywords need the word-frequency fallback (which ranks words, not terms).
+    """
+
+    def __init__(self, name, role, category=None, analysis=None):
+        # nlp_engine imports this module, so its helpers are imported on first build
+        from nlp_engine import tokenize, KeywordRanking, TokenizedText
+
+        self.name = name
+        self.description = role["description"]
+        self.level = role.get("level")
+        self.category = category or get_role_category(name)
+        self.ranking = None
+        if analysis is not None:
+            self.tokens = TokenizedText.from_term_counts(analysis["vector"])
+            self.ranking = KeywordRanking(self.description, self.tokens)
+        if self.ranking is None or self.ranking.fallback is not None:
+            self.tokens = tokenize(self.description)
+            self.ranking = KeywordRanking(self.description, self.tokens)
+        if analysis is not None:
+            self.keywords = list(analysis["keywords"])
+            self.skills = list(analysis["skills"])
+            self.taxonomy_digest = analysis["taxonomy"]
+        else:
+            self.keywords = self.ranking.top(30)
+            self.skills = extract_skills(self.description)
+            self.taxonomy_digest = get_taxonomy().digest
+        self.skill_set = frozenset(self.skills)
+
+
+class RoleCatalog:
+    """RoleProfile for every role in ROLES, keyed by name and by description"""
+
+    def __init__(self, roles, fingerprint):
+        self.fingerprint = fingerprint
+        self.profiles = {name: RoleProfile(name, role) for name, role in roles.items()}
+        self.by_description = {p.description: p for p in self.profiles.values()}
+
+    def __getitem__(self, name):
+        return self.profiles[name]
+
+    def __iter__(self):
+        return iter(self.profiles.values())
+
+    def __len__(self):
+        return len(self.profiles)
+
+
+def roles_fingerprint():
+    """Hash of ROLES and the skills taxonomy: changes whenever a catalog would"""
+    h = hashlib.sha256(json.dumps(ROLES, sort_keys=True).encode("utf-8"))
+    h.update(get_taxonomy().digest.encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_role_catalog():
+    """RoleCatalog of the current ROLES, rebuilt when ROLES or the skills taxonomy changes"""
+    global _catalog
+    fingerprint = roles_fingerprint()
+    catalog = _catalog
+    if catalog is not None and catalog.fingerprint == fingerprint:
+        return catalog
+    with _catalog_lock:
+        if _catalog is None or _catalog.fingerprint != fingerprint:
+            _catalog = RoleCatalog(ROLES, fingerprint)
+        return _catalog
+
+
+# Profiles of custom job descriptions (see jd_library), most recently registered last
+CUSTOM_PROFILE_LIMIT = 64
+_custom_profiles = OrderedDict()
+
+
+def register_profile(profile):
+    """Let find_role() return `profile` for its description (e.g. a JD library entry)"""
+    with _catalog_lock:
+        _custom_profiles[profile.description] = profile
+        _custom_profiles.move_to_end(profile.description)
+        while len(_custom_profiles) > CUSTOM_PROFILE_LIMIT:
+            _custom_profiles.popitem(last=False)
+
+
+def find_role(job_description):
+    """RoleProfile whose description is exactly `job_description`, or None.
+
+    Covers every role in ROLES and the registered custom profiles whose
+    skills were extracted with the current skills taxonomy.
+    """
+    profile = get_role_catalog().by_description.get(job_description)
+    if profile is None:
+        profile = _custom_profiles.get(job_description)
+        if profile is not None and profile.taxonomy_digest != get_taxonomy().digest:
+            return None
+    return profile
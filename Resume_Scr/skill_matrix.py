@@ -0,0 +1,121 @@
+import numpy as np
+
+from skills import get_taxonomy
+
+# Set bits per byte value, for popcounts over packed rows
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+# -------- Skill Matrix --------
+class SkillMatrix:
+    """Candidates x skills as bit-packed rows, for pool-wide filters and gap stats.
+
+    Row i holds the skills of candidate i (one bit per column, np.packbits
+    layout). Columns are the taxonomy's skills followed by any other skill a
+    candidate lists (e.g. parsed under an older taxonomy); `columns` maps a
+    skill to its column and `category_masks` holds one packed column mask per
+    taxonomy category. Every query is a few byte-wise AND/popcount passes over
+    the matrix.
+    """
+
+    def __init__(self, skill_lists, taxonomy=None):
+        taxonomy = taxonomy or get_taxonomy()
+        skill_lists = [list(skills or []) for skills in skill_lists]
+
+        self.skills = list(taxonomy.skills)
+        self.columns = {skill: i for i, skill in enumerate(self.skills)}
+        for skills in skill_lists:
+            for skill in skills:
+                if skill not in self.columns:
+                    self.columns[skill] = len(self.skills)
+                    self.skills.append(skill)
+
+        rows = np.zeros((len(skill_lists), len(self.skills)), dtype=bool)
+        lengths = [len(skills) for skills in skill_lists]
+        cols = [self.columns[s] for skills in skill_lists for s in skills]
+        rows[np.repeat(np.arange(len(skill_lists)), lengths), np.array(cols, dtype=np.int64)] = True
+        self.bits = np.packbits(rows, axis=1)
+
+        self.category_masks = {
+            category: self.mask(skills) for category, skills in taxonomy.categories.items()
+        }
+
+    def __len__(self):
+        return self.bits.shape[0]
+
+    def mask(self, skills):
+        """Packed column mask of the given skills (skills without a column are ignored)"""
+        cols = np.zeros(len(self.skills), dtype=bool)
+        cols[[self.columns[s] for s in skills if s in self.columns]] = True
+        return np.packbits(cols)
+
+    def _masked(self, mask):
+        """(bits & mask, mask) restricted to the bytes where the mask has bits"""
+        nz = np.flatnonzero(mask)
+        return self.bits[:, nz] & mask[nz], mask[nz]
+
+    def count(self, mask):
+        """Per candidate, how many of the mask's skills they have"""
+        masked, _ = self._masked(mask)
+        return POPCOUNT[masked].sum(axis=1, dtype=np.int64)
+
+    def has(self, skill):
+        """Boolean array: which candidates have `skill`"""
+        col = self.columns.get(skill)
+        if col is None:
+            return np.zeros(len(self), dtype=bool)
+        return (self.bits[:, col >> 3] >> (7 - (col & 7))) & 1 == 1
+
+    def filter(self, all_of=(), any_of=(), none_of=(), min_in_category=None):
+        """Boolean array of candidates with every `all_of` skill, at least one `any_of`
+        skill (if given), no `none_of` skill, and at least n skills in each category
+        of `min_in_category` ({category: n})"""
+        keep = np.ones(len(self), dtype=bool)
+        required = list(dict.fromkeys(all_of))
+        if any(s not in self.columns for s in required):
+            return np.zeros(len(self), dtype=bool)
+        if required:
+            masked, mask = self._masked(self.mask(required))
+            keep &= (masked == mask).all(axis=1)
+        if any_of:
+            masked, _ = self._masked(self.mask(any_of))
+            keep &= masked.any(axis=1)
+        if none_of:
+            masked, _ = self._masked(self.mask(none_of))
+            keep &= ~masked.any(axis=1)
+        for category, n in (min_in_category or {}).items():
+            keep &= self.count(self.category_masks.get(category, self.mask([]))) >= n
+        return keep
+
+    def coverage(self, skills=None):
+        """{skill: number of candidates with it}, for `skills` or every column"""
+        if skills is not None:
+            return {s: int(self.has(s).sum()) for s in skills}
+        counts = np.unpackbits(self.bits, axis=1, count=len(self.skills)).sum(axis=0, dtype=np.int64)
+        return dict(zip(self.skills, counts.tolist()))
+
+    def category_counts(self):
+        """{category: per-candidate count of skills in that category}"""
+        return {category: self.count(mask) for category, mask in self.category_masks.items()}
+
+    def gap(self, job_skills):
+        """skill_gap against one job's skills for every candidate at once.
+
+        Returns arrays over candidates ("matched", "missing" counts and
+        "match_percentage" as skill_gap rounds it) plus "missing_coverage":
+        {job skill: number of candidates without it}.
+        """
+        job_skills = list(dict.fromkeys(job_skills))
+        matched = self.count(self.mask(job_skills))
+        total = len(job_skills)
+        if total:
+            percentage = np.round(matched / total * 100, 2)
+        else:
+            percentage = np.zeros(len(self))
+        coverage = self.coverage(job_skills)
+        return {
+            "matched": matched,
+            "missing": total - matched,
+            "match_percentage": percentage,
+            "missing_coverage": {s: len(self) - coverage[s] for s in job_skills}
+        }
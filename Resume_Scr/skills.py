@@ -1,130 +1,254 @@
-# Comprehensive Skills Database - 100+ Skills
-
-SKILLS_DB = {
-    # Programming Languages
-    "programming": [
-        "python", "java", "javascript", "typescript", "c++", "c#", "php", 
-        "ruby", "go", "golang", "rust", "kotlin", "swift", "r", "matlab",
-        "scala", "perl", "shell scripting", "bash", "powershell"
-    ],
-    
-    # Web Development
-    "web_development": [
-        "html", "css", "react", "angular", "vue", "node.js", "express",
-        "django", "flask", "fastapi", "spring boot", "asp.net", "laravel",
-        "next.js", "nuxt.js", "jquery", "bootstrap", "tailwind css",
-        "sass", "webpack", "rest api", "graphql", "web services"
-    ],
-    
-    # Mobile Development
-    "mobile": [
-        "android", "ios", "react native", "flutter", "xamarin", 
-        "ionic", "kotlin", "swift", "mobile development"
-    ],
-    
-    # Data Science & ML
-    "data_science": [
-        "machine learning", "deep learning", "data science", "artificial intelligence",
-        "neural networks", "computer vision", "nlp", "natural language processing",
-        "statistics", "data analysis", "data mining", "predictive modeling",
-        "time series", "a/b testing", "statistical modeling"
-    ],
-    
-    # ML Frameworks & Libraries
-    "ml_frameworks": [
-        "tensorflow", "pytorch", "keras", "scikit-learn", "xgboost",
-        "lightgbm", "catboost", "pandas", "numpy", "scipy", "opencv",
-        "hugging face", "transformers", "bert", "gpt", "llm"
-    ],
-    
-    # Big Data
-    "big_data": [
-        "hadoop", "spark", "pyspark", "hive", "kafka", "flink",
-        "storm", "cassandra", "mongodb", "elasticsearch", "big data"
-    ],
-    
-    # Databases
-    "databases": [
-        "sql", "mysql", "postgresql", "oracle", "sql server", "mongodb",
-        "redis", "dynamodb", "cassandra", "neo4j", "sqlite", "mariadb",
-        "database design", "nosql", "database optimization"
-    ],
-    
-    # Cloud & DevOps
-    "cloud": [
-        "aws", "azure", "google cloud", "gcp", "docker", "kubernetes",
-        "jenkins", "ci/cd", "terraform", "ansible", "devops", "cloudformation",
-        "lambda", "ec2", "s3", "azure functions", "microservices"
-    ],
-    
-    # Data Visualization & BI
-    "visualization": [
-        "tableau", "power bi", "excel", "looker", "qlikview", "d3.js",
-        "matplotlib", "seaborn", "plotly", "data visualization", "dashboards"
-    ],
-    
-    # Version Control & Collaboration
-    "tools": [
-        "git", "github", "gitlab", "bitbucket", "jira", "confluence",
-        "agile", "scrum", "kanban", "version control"
-    ],
-    
-    # Testing
-    "testing": [
-        "unit testing", "selenium", "pytest", "junit", "test automation",
-        "integration testing", "api testing", "performance testing"
-    ],
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+try:
+    import yaml
+except ImportError:  # PyYAML missing: only JSON taxonomies can be loaded
+    yaml = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Skills taxonomy: {"version", "categories": {category: [skill, ...]}, "aliases": {skill: [alias, ...]}}
+# as JSON, or YAML (.yaml/.yml) when PyYAML is installed
+SKILLS_TAXONOMY_PATH = os.environ.get("RESUME_SKILLS_TAXONOMY", os.path.join(BASE_DIR, "skills_taxonomy.json"))
+
+# Compiled matchers, one JSON artifact per taxonomy content hash
+SKILLS_MATCHER_CACHE = os.environ.get("RESUME_SKILLS_MATCHER_CACHE", os.path.join(BASE_DIR, ".cache", "skills"))
+
+# Seconds between checks of the taxonomy file for changes (hot reload)
+TAXONOMY_CHECK_INTERVAL = float(os.environ.get("RESUME_TAXONOMY_CHECK_INTERVAL", 2))
+
+# Bump when the matching rules or the artifact layout change
+MATCHER_FORMAT = "1"
+
+
+# -------- Skill Matcher --------
+def _skill_pattern(skills):
+    """One regex over all skills, shaped as a trie of their characters.
+
+    A skill must not touch a word character on a side where its own edge is a
+    word character (the \\b rule); a non-word edge such as the "+" of c++ or
+    the "#" of c# needs no boundary. At each start position the longest skill
+    wins, and the zero-width lookahead lets matches overlap.
+    """
+    if not skills:
+        return '(?!)'
+    trie = {}
+    for skill in skills:
+        node = trie
+        for char in skill:
+            node = node.setdefault(char, {})
+        node[""] = skill
+
+    def branch(node, last):
+        options = [re.escape(char) + branch(child, char) for char, child in sorted(node.items()) if char]
+        if "" in node:
+            # Ending here is tried last, so longer skills win
+            options.append(r'(?!\w)' if _is_word_char(last) else '')
+        if len(options) == 1:
+            return options[0]
+        return '(?:' + '|'.join(options) + ')'
+
+    # Same rule at the start; when every skill starts with a word character it is hoisted
+    if all(_is_word_char(char) for char in trie):
+        return r'(?<!\w)(?=(' + branch(trie, '') + '))'
+    starts = [(r'(?<!\w)' if _is_word_char(char) else '') + re.escape(char) + branch(child, char)
+              for char, child in sorted(trie.items())]
+    return '(?=(' + '|'.join(starts) + '))'
+
+
+def _is_word_char(char):
+    return re.match(r'\w', char) is not None
+
+
+def _implied_skills(skill, skills):
+    """Shorter skills that match wherever `skill` does, at the same start (react in react native)"""
+    return [
+        other for other in skills
+        if other != skill and skill.startswith(other)
+        and not (_is_word_char(other[-1]) and _is_word_char(skill[len(other)]))
+    ]
+
+
+# -------- Skills Taxonomy --------
+class SkillTaxonomy:
+    """Canonical skills by category, their aliases, and the compiled matcher.
+
+    Every skill and alias is a "surface" string the matcher looks for; a match
+    reports the canonical skill (k8s -> kubernetes).
+    """
+
+    def __init__(self, data, digest):
+        self.digest = digest
+        self.version = data.get("version")
+        
+        self.categories = {}
+        for category, skills in (data.get("categories") or {}).items():
+            self.categories[category] = [str(skill).strip().lower() for skill in skills]
+        self.skills = list(dict.fromkeys(s for skills in self.categories.values() for s in skills if s))
+        
+        self.aliases = {}
+        known = set(self.skills)
+        for skill, aliases in (data.get("aliases") or {}).items():
+            skill = str(skill).strip().lower()
+            if skill not in known:
+                print(f"Skills taxonomy: alias target '{skill}' is not a skill, ignored")
+                continue
+            for alias in aliases:
+                alias = str(alias).strip().lower()
+                if alias and alias not in known and alias not in self.aliases:
+                    self.aliases[alias] = skill
+        self.category_sets = {category: set(skills) for category, skills in self.categories.items()}
+        self.pattern = None
+
+    def compile(self):
+        """Build the matcher; returns it as a JSON-serializable artifact"""
+        surfaces = dict(zip(self.skills, self.skills))
+        surfaces.update(self.aliases)
+        names = list(surfaces)
+        artifact = {
+            "format": MATCHER_FORMAT,
+            "digest": self.digest,
+            "pattern": _skill_pattern(names),
+            "surfaces": surfaces,
+            "implied": {
+                name: [surfaces[other] for other in _implied_skills(name, names)] for name in names
+            }
+        }
+        self.use(artifact)
+        return artifact
+
+    def use(self, artifact):
+        """Adopt a compiled matcher artifact"""
+        self.pattern = re.compile(artifact["pattern"])
+        self.surfaces = artifact["surfaces"]
+        self.implied = artifact["implied"]
+
+    def extract(self, text):
+        """Canonical skills mentioned in text (one scan)"""
+        found = set()
+        for match in self.pattern.finditer(text.lower()):
+            surface = match.group(1)
+            found.add(self.surfaces[surface])
+            found.update(self.implied[surface])
+        return list(found)
+
+
+def read_taxonomy(path=SKILLS_TAXONOMY_PATH):
+    """(data, digest) of a taxonomy file; the digest hashes its bytes and MATCHER_FORMAT"""
+    with open(path, "rb") as f:
+        content = f.read()
+    digest = hashlib.sha256(MATCHER_FORMAT.encode("utf-8") + content).hexdigest()[:16]
     
-    # Cybersecurity
-    "security": [
-        "cybersecurity", "penetration testing", "ethical hacking",
-        "network security", "encryption", "firewall", "vulnerability assessment"
-    ],
+    if path.endswith((".yaml", ".yml")):
+        if yaml is None:
+            raise ValueError(f"{path}: PyYAML is not installed")
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise ValueError(f"{path}: {e}")
+    else:
+        data = json.loads(content)
+    if not isinstance(data, dict) or not isinstance(data.get("categories"), dict):
+        raise ValueError(f"{path}: expected a mapping with a 'categories' mapping")
+    return data, digest
+
+
+def load_taxonomy(path=SKILLS_TAXONOMY_PATH, cache_dir=SKILLS_MATCHER_CACHE):
+    """Load a taxonomy file, reusing the compiled matcher cached under its content hash"""
+    data, digest = read_taxonomy(path)
+    taxonomy = SkillTaxonomy(data, digest)
     
-    # Other Technical
-    "other_technical": [
-        "linux", "unix", "windows server", "networking", "tcp/ip",
-        "dns", "load balancing", "monitoring", "etl", "data warehousing",
-        "business intelligence", "data engineering", "system design"
-    ],
+    artifact_path = os.path.join(cache_dir, f"matcher-{digest}.json")
+    try:
+        with open(artifact_path, encoding="utf-8") as f:
+            artifact = json.load(f)
+        if artifact.get("format") == MATCHER_FORMAT and artifact.get("digest") == digest:
+            taxonomy.use(artifact)
+            return taxonomy
+    except (OSError, ValueError, KeyError, re.error):
+        pass
     
-    # Soft Skills
-    "soft_skills": [
-        "leadership", "communication", "problem solving", "teamwork",
-        "project management", "analytical thinking", "critical thinking",
-        "presentation", "stakeholder management", "mentoring"
-    ]
-}
+    artifact = taxonomy.compile()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{artifact_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(artifact, f)
+        os.replace(tmp, artifact_path)
+        for name in os.listdir(cache_dir):
+            if name.startswith("matcher-") and name != os.path.basename(artifact_path):
+                os.remove(os.path.join(cache_dir, name))
+    except OSError as e:
+        print(f"Skills matcher not cached: {e}")
+    return taxonomy
+
+
+def _file_stat(path):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _install(taxonomy):
+    """Make `taxonomy` the one extract_skills uses (and refresh SKILLS_DB / ALL_SKILLS)"""
+    global _taxonomy, SKILLS_DB, ALL_SKILLS
+    _taxonomy = taxonomy
+    SKILLS_DB = taxonomy.categories
+    ALL_SKILLS = taxonomy.skills
+
 
-# Flatten all skills into a single list
-ALL_SKILLS = []
-for category in SKILLS_DB.values():
-    ALL_SKILLS.extend(category)
+def get_taxonomy():
+    """The current taxonomy, reloaded when the taxonomy file has changed.
 
-# Remove duplicates
-ALL_SKILLS = list(set(ALL_SKILLS))
+    The file is checked at most every TAXONOMY_CHECK_INTERVAL seconds, so a
+    running app picks up edits without a restart. A file that fails to load
+    leaves the previous taxonomy in place.
+    """
+    global _taxonomy_stat, _taxonomy_checked
+    now = time.monotonic()
+    if now - _taxonomy_checked < TAXONOMY_CHECK_INTERVAL:
+        return _taxonomy
+    with _taxonomy_lock:
+        if now - _taxonomy_checked >= TAXONOMY_CHECK_INTERVAL:
+            stat = _file_stat(SKILLS_TAXONOMY_PATH)
+            if stat != _taxonomy_stat:
+                _taxonomy_stat = stat
+                try:
+                    _install(load_taxonomy(SKILLS_TAXONOMY_PATH))
+                except (OSError, ValueError) as e:
+                    print(f"Skills taxonomy not reloaded: {e}")
+            _taxonomy_checked = time.monotonic()
+    return _taxonomy
+
+
+_taxonomy_lock = threading.Lock()
+_taxonomy_stat = _file_stat(SKILLS_TAXONOMY_PATH)
+_taxonomy_checked = time.monotonic()
+try:
+    _install(load_taxonomy(SKILLS_TAXONOMY_PATH))
+except (OSError, ValueError) as e:
+    print(f"Skills taxonomy could not be loaded: {e}")
+    _install(SkillTaxonomy({"categories": {}}, "empty"))
+    _taxonomy.compile()
 
 
 def extract_skills(text):
-    """Extract skills from text using comprehensive skills database"""
-    text = text.lower()
-    found = []
-    
-    for skill in ALL_SKILLS:
-        # Use word boundary matching for better accuracy
-        import re
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text):
-            found.append(skill)
-    
-    return list(set(found))
+    """Extract skills from text using the skills taxonomy (one scan of the text)"""
+    return get_taxonomy().extract(text)
 
 
 def categorize_skills(skills_list):
     """Categorize extracted skills by domain"""
     categorized = {}
     
-    for category, skills in SKILLS_DB.items():
+    for category, skills in get_taxonomy().category_sets.items():
         category_skills = [s for s in skills_list if s in skills]
         if category_skills:
             categorized[category] = category_skills
@@ -132,10 +256,20 @@ def categorize_skills(skills_list):
     return categorized
 
 
-def skill_gap(resume_text, job_text):
-    """Analyze skill gap between resume and job description"""
-    resume_skills = extract_skills(resume_text)
-    job_skills = extract_skills(job_text)
+def skill_gap(resume_text, job_text, context=None, job_skills=None):
+    """Analyze skill gap between resume and job description
+
+    `job_skills` are the JD's skills if already known (e.g. a role catalog
+    entry's skills); `context` supplies both sides.
+    """
+    if context is not None:
+        # Skills already extracted for this resume/JD pair (nlp_engine.AnalysisContext)
+        resume_skills = context.resume_skills
+        job_skills = context.job_skills
+    else:
+        resume_skills = extract_skills(resume_text)
+        if job_skills is None:
+            job_skills = extract_skills(job_text)
     
     missing = list(set(job_skills) - set(resume_skills))
     matched = list(set(job_skills) & set(resume_skills))
@@ -0,0 +1,26 @@
+"""
+Regression checks for ScreeningSession.
+
+Usage:
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlp_engine import ScreeningSession
+
+
+@pytest.mark.parametrize("job_description", ["", "--- !!!"])
+def test_termless_job_description_scores_zero(job_description):
+    session = ScreeningSession(job_description)
+    session.add({"text": "python sql aws docker", "skills": []})
+    session.add({"text": "java spring kubernetes", "skills": []})
+    assert [record["score"] for record in session.ranked()] == [0, 0]
+
+    session.set_job_description("python developer")
+    assert session.ranked()[0]["score"] > 0